@@ -1,9 +1,9 @@
-from .dice import roll_damage
+from .dice import roll_5d4, roll_damage
 from .entities import Character, Monster
 from .companion import summon_companion, companion_turn
-from .data_loader import get_dialogue, load_monster_descriptions, get_npc_dialogue
+from .data_loader import get_dialogue, get_monster_description, get_npc_dialogue
 import random
-import math
+import re
 
 
 class TeleportToTown(Exception):
@@ -13,7 +13,7 @@ class TeleportToTown(Exception):
 def compute_armor_class(character: Character, ac_bonus: int = 0) -> int:
     # Base AC = 10 + Constitution/2 (rounded up) to match new mechanics
     constitution = character.attributes.get("Constitution", 10)
-    base_ac = 10 + math.ceil(constitution / 2)
+    base_ac = 10 + (constitution + 1) // 2
 
     # Add armor AC
     armor_ac = 0
@@ -21,7 +21,7 @@ def compute_armor_class(character: Character, ac_bonus: int = 0) -> int:
         # Damaged armor provides reduced protection (half armor AC)
         armor_ac = (
             character.armor.armor_class // 2
-            if getattr(character.armor, "damaged", False)
+            if character.armor.damaged
             else character.armor.armor_class
         )
     else:
@@ -41,59 +41,39 @@ def examine_monster(character: Character, monster: Monster) -> bool:
     Returns True if successful.
     NOTE: Does NOT trigger monster attack (can only be used once per combat)."""
     wis = character.attributes.get("Wisdom", 10)
-    roll = roll_damage("5d4") + wis
-    intro = (
-        get_dialogue("combat", "examine_attempt", None, character)
-        or f"You examine the {monster.name}..."
-    )
-    intro_line = (intro + " (Wisdom check: {roll} vs 25)") if intro else None
-    print(
-        (
-            get_dialogue("combat", "examine_intro", None, character)
-            or intro_line
-            or f"You examine the {monster.name}... (Wisdom check: {roll} vs 25)"
-        ).format(roll=roll)
-    )
+    roll = roll_5d4() + wis
+    intro = get_dialogue("combat", "examine_intro", None, character)
+    if not intro:
+        intro = (
+            get_dialogue("combat", "examine_attempt", None, character)
+            or f"You examine the {monster.name}..."
+        ) + " (Wisdom check: {roll} vs 25)"
+    print(intro.format(roll=roll))
     if roll > 25:
         hp_line = (
             get_dialogue("combat", "examine_result", None, character)
             or "You can see: HP {hp}, AC {ac}"
         )
         print(hp_line.format(hp=monster.hp, ac=monster.armor_class))
-        if hasattr(monster, "dexterity"):
+        dex = getattr(monster, "dexterity", None)
+        if dex is not None:
             dex_line = (
                 get_dialogue("combat", "examine_dex", None, character)
                 or "Dexterity: {dex}"
             )
-            print(dex_line.format(dex=monster.dexterity))
-        if hasattr(monster, "abilities") and monster.abilities:
+            print(dex_line.format(dex=dex))
+        abilities = getattr(monster, "abilities", None)
+        if abilities:
             abil_line = (
                 get_dialogue("combat", "examine_abilities", None, character)
                 or "Special abilities: {abilities}"
             )
-            print(abil_line.format(abilities=", ".join(monster.abilities)))
-        # Also show a textual description for the monster if available in data/monsters_desc.json
-        try:
-            desc_map = load_monster_descriptions() or {}
-            # Normalized lookup: prefer exact name, fall back to title-cased name
-            desc = desc_map.get(monster.name) or desc_map.get(str(monster.name).title())
-            if desc:
-                # Print a concise description using monster name and the description text
-                print(f"It's a {monster.name} - {desc}")
-        except Exception:
-            # If description loading fails for any reason, skip silently
-            pass
+            print(abil_line.format(abilities=", ".join(abilities)))
         # Also show a textual description for the monster if available in data/monsters_desc.json
-        try:
-            desc_map = load_monster_descriptions() or {}
-            # Normalized lookup: prefer exact name, fall back to title-cased name
-            desc = desc_map.get(monster.name) or desc_map.get(str(monster.name).title())
-            if desc:
-                # Print a concise description using monster name and the description text
-                print(f"It's a {monster.name} - {desc}")
-        except Exception:
-            # If description loading fails for any reason, skip silently
-            pass
+        desc = get_monster_description(monster.name)
+        if desc:
+            # Print a concise description using monster name and the description text
+            print(f"It's a {monster.name} - {desc}")
         return True  # Successful examine
     else:
         print(
@@ -124,6 +104,94 @@ def choose_weapon(character: Character):
         return character.weapons[0]
 
 
+def _potion_healing(character: Character, buffs: dict, name: str) -> bool:
+    # Heal 2d4
+    heal = max(1, roll_damage("2d4"))
+    character.hp = min(character.max_hp, character.hp + heal)
+    print(
+        get_dialogue("combat", "potion_heal", None, character)
+        or f"You drink a healing potion and recover {heal} HP."
+    )
+    if name == "Healing_legacy":
+        character.potions -= 1
+    else:
+        character.potion_uses[name] -= 1
+    return True
+
+
+def _potion_intelligence(character: Character, buffs: dict, name: str) -> bool:
+    buffs["damage_bonus"] = buffs.get("damage_bonus", 0) + 1
+    character.potion_uses[name] -= 1
+    print(
+        get_dialogue("combat", "potion_focus", None, character)
+        or "You feel more focused. (+1 damage this combat)"
+    )
+    return True
+
+
+def _potion_speed(character: Character, buffs: dict, name: str) -> bool:
+    buffs["extra_attack_charges"] = buffs.get("extra_attack_charges", 0) + 1
+    character.potion_uses[name] -= 1
+    print(
+        get_dialogue("combat", "potion_speed", None, character)
+        or "Your reflexes quicken. (1 extra attack this combat)"
+    )
+    return True
+
+
+def _potion_strength(character: Character, buffs: dict, name: str) -> bool:
+    buffs["damage_bonus"] = buffs.get("damage_bonus", 0) + 2
+    character.potion_uses[name] -= 1
+    print(
+        get_dialogue("combat", "potion_strength", None, character)
+        or "Your muscles surge. (+2 damage this combat)"
+    )
+    return True
+
+
+def _potion_protection(character: Character, buffs: dict, name: str) -> bool:
+    buffs["ac_bonus"] = buffs.get("ac_bonus", 0) + 3
+    character.potion_uses[name] -= 1
+    print(
+        get_dialogue("combat", "potion_protection", None, character)
+        or "A shimmering barrier surrounds you. (+3 AC this combat)"
+    )
+    return True
+
+
+def _potion_invisibility(character: Character, buffs: dict, name: str) -> bool:
+    buffs["invisibility_charges"] = buffs.get("invisibility_charges", 0) + 1
+    character.potion_uses[name] -= 1
+    print(
+        get_dialogue("combat", "potion_invisibility", None, character)
+        or "You fade from sight. (Monster's next attack automatically misses)"
+    )
+    return True
+
+
+def _potion_antidote(character: Character, buffs: dict, name: str) -> bool:
+    character.potion_uses[name] -= 1
+    character.persistent_buffs.pop("debuff_poison", None)
+    print(
+        get_dialogue("combat", "potion_antidote", None, character)
+        or "You drink the antidote and feel the poison leave your system."
+    )
+    return True
+
+
+# Potion effects keyed by lower-cased potion name
+_POTION_HANDLERS = {
+    "healing_legacy": _potion_healing,
+    "healing": _potion_healing,
+    "intelligence": _potion_intelligence,
+    "speed": _potion_speed,
+    "strength": _potion_strength,
+    "protection": _potion_protection,
+    "invisibility": _potion_invisibility,
+    "antidote": _potion_antidote,
+}
+
+
 def use_potion(character: Character, buffs: dict) -> bool:
     # List available potions by name with remaining uses
     available = {name: uses for name, uses in character.potion_uses.items() if uses > 0}
@@ -148,7 +216,7 @@ def use_potion(character: Character, buffs: dict) -> bool:
             get_dialogue("combat", "potion_option", None, character) or "{idx}) {label}"
         )
         print(opt.format(idx=idx, label="Healing (legacy) (1 use)"))
-        options.append((idx, ("Healing_legacy", 1)))
+        options.append(("Healing_legacy", 1))
         idx += 1
     for name, uses in available.items():
         opt = (
@@ -156,85 +224,171 @@ def use_potion(character: Character, buffs: dict) -> bool:
             or "{idx}) {label} ({uses} uses left)"
         )
         print(opt.format(idx=idx, label=name, uses=uses))
-        options.append((idx, (name, uses)))
+        options.append((name, uses))
         idx += 1
     print(get_dialogue("system", "enter_number", None, character) or ">")
     choice = input("> ").strip()
     if not choice.isdigit():
         return False
     sel = int(choice)
-    match = next((x for x in options if x[0] == sel), None)
-    if not match:
+    if not 1 <= sel <= len(options):
         return False
-    name, uses = match[1]
+    name, uses = options[sel - 1]
     # Apply effects
-    if name == "Healing_legacy" or name.lower() == "healing":
-        # Heal 2d4
-        heal = max(1, roll_damage("2d4"))
-        character.hp = min(character.max_hp, character.hp + heal)
-        print(
-            get_dialogue("combat", "potion_heal", None, character)
-            or f"You drink a healing potion and recover {heal} HP."
-        )
-        if name == "Healing_legacy":
-            character.potions -= 1
-        else:
-            character.potion_uses[name] -= 1
-        return True
-    elif name.lower() == "intelligence":
-        buffs["damage_bonus"] = buffs.get("damage_bonus", 0) + 1
-        character.potion_uses[name] -= 1
-        print(
-            get_dialogue("combat", "potion_focus", None, character)
-            or "You feel more focused. (+1 damage this combat)"
-        )
-        return True
-    elif name.lower() == "speed":
-        buffs["extra_attack_charges"] = buffs.get("extra_attack_charges", 0) + 1
-        character.potion_uses[name] -= 1
-        print(
-            get_dialogue("combat", "potion_speed", None, character)
-            or "Your reflexes quicken. (1 extra attack this combat)"
-        )
-        return True
-    elif name.lower() == "strength":
-        buffs["damage_bonus"] = buffs.get("damage_bonus", 0) + 2
-        character.potion_uses[name] -= 1
-        print(
-            get_dialogue("combat", "potion_strength", None, character)
-            or "Your muscles surge. (+2 damage this combat)"
-        )
-        return True
-    elif name.lower() == "protection":
-        buffs["ac_bonus"] = buffs.get("ac_bonus", 0) + 3
-        character.potion_uses[name] -= 1
-        print(
-            get_dialogue("combat", "potion_protection", None, character)
-            or "A shimmering barrier surrounds you. (+3 AC this combat)"
-        )
-        return True
-    elif name.lower() == "invisibility":
-        buffs["invisibility_charges"] = buffs.get("invisibility_charges", 0) + 1
-        character.potion_uses[name] -= 1
-        print(
-            get_dialogue("combat", "potion_invisibility", None, character)
-            or "You fade from sight. (Monster's next attack automatically misses)"
-        )
-        return True
-    elif name.lower() == "antidote":
-        character.potion_uses[name] -= 1
-        character.persistent_buffs.pop("debuff_poison", None)
-        print(
-            get_dialogue("combat", "potion_antidote", None, character)
-            or "You drink the antidote and feel the poison leave your system."
-        )
-        return True
-    else:
+    handler = _POTION_HANDLERS.get(name.lower())
+    if handler is None:
         print(
             get_dialogue("combat", "nothing_happens", None, character)
             or "Nothing happens..."
         )
         return False
+    return handler(character, buffs, name)
+
+
+def _resisted(dmg: int, resist: int) -> int:
+    return max(0, dmg - resist)
+
+
+def _spell_summon_creature(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    roll = roll_5d4()
+    print(
+        get_dialogue("combat", "summon_attempt", None, character)
+        or f"You attempt to summon a companion... Roll {roll}"
+    )
+    return bool(summon_companion(character, roll))
+
+
+def _spell_magic_missile(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    dmg = _resisted(max(1, roll_damage("2d6")), resist)
+    monster.hp -= dmg
+    print(
+        get_dialogue("combat", "magic_missile", None, character)
+        or f"Magic missiles strike for {dmg} damage. Monster HP: {max(monster.hp, 0)}"
+    )
+    return True
+
+
+def _spell_weakness(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    enemy_debuffs["damage_penalty"] = enemy_debuffs.get("damage_penalty", 0) + 2
+    print(
+        get_dialogue("combat", "weakness_effect", None, character)
+        or "The foe looks feebler. (-2 damage this combat)"
+    )
+    return True
+
+
+def _spell_slowness(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    enemy_debuffs["damage_penalty"] = enemy_debuffs.get("damage_penalty", 0) + 2
+    print(
+        get_dialogue("combat", "slowness_effect", None, character)
+        or "The foe slows. (-2 damage this combat)"
+    )
+    return True
+
+
+def _spell_lightning_bolt(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    print(
+        get_dialogue("combat", "choose_aim", None, character)
+        or "Choose power level:"
+    )
+    print(
+        get_dialogue("combat", "full_power_option", None, character)
+        or "1) Full power"
+    )
+    print(
+        get_dialogue("combat", "half_power_option", None, character)
+        or "2) Half power"
+    )
+    print(get_dialogue("system", "enter_number", None, character) or ">")
+    mode = input("> ").strip()
+    die = "6d6" if mode == "1" else "3d6"
+    dmg = _resisted(max(1, roll_damage(die)), resist)
+    monster.hp -= dmg
+    print(
+        get_dialogue("combat", "lightning_bolt", None, character)
+        or f"Lightning arcs for {dmg} damage. Monster HP: {max(monster.hp, 0)}"
+    )
+    return True
+
+
+def _spell_freeze(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    enemy_debuffs["freeze_turns"] = enemy_debuffs.get("freeze_turns", 0) + 1
+    print(
+        get_dialogue("combat", "freeze_effect", None, character)
+        or "Ice binds the monster. (It skips its next turn)"
+    )
+    return True
+
+
+def _spell_vulnerability(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    enemy_debuffs["ac_penalty"] = enemy_debuffs.get("ac_penalty", 0) + 2
+    print(
+        get_dialogue("combat", "vulnerability_effect", None, character)
+        or "Cracks appear in its defenses. (-2 AC this combat)"
+    )
+    return True
+
+
+def _spell_fireball(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    dmg = _resisted(max(1, roll_damage("4d6")), resist)
+    monster.hp -= dmg
+    print(
+        get_dialogue("combat", "fireball", None, character)
+        or f"Fireball explodes for {dmg} damage. Monster HP: {max(monster.hp, 0)}"
+    )
+    return True
+
+
+def _spell_teleport_to_town(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    print(
+        get_dialogue("combat", "teleport_to_town", None, character)
+        or "A portal whisks you away to town!"
+    )
+    raise TeleportToTown()
+
+
+def _spell_magic_portal(
+    character: Character, monster: Monster, enemy_debuffs: dict, resist: int
+) -> bool:
+    print(
+        get_dialogue("combat", "magic_portal", None, character)
+        or "You conjure a portal and step through to safety."
+    )
+    raise TeleportToTown()
+
+
+# Spell effects keyed by lower-cased spell name. Handlers return True when the
+# cast succeeded and a use should be spent.
+_SPELL_HANDLERS = {
+    "summon creature": _spell_summon_creature,
+    "magic missile": _spell_magic_missile,
+    "weakness": _spell_weakness,
+    "slowness": _spell_slowness,
+    "lightning bolt": _spell_lightning_bolt,
+    "freeze": _spell_freeze,
+    "vulnerability": _spell_vulnerability,
+    "fireball": _spell_fireball,
+    "teleport to town": _spell_teleport_to_town,
+    "magic portal": _spell_magic_portal,
+}
 
 
 def cast_spell(
@@ -254,125 +408,38 @@ def cast_spell(
             or "Spells (choose by number):"
         )
     )
-    options = []
-    idx = 1
-    for name, uses in available.items():
+    options = list(available)
+    for idx, (name, uses) in enumerate(available.items(), start=1):
         opt = (
             get_dialogue("combat", "spell_option", None, character)
             or "{idx}) {label} ({uses} uses left)"
         )
         print(opt.format(idx=idx, label=name, uses=uses))
-        options.append((idx, name))
-        idx += 1
     print(get_dialogue("system", "enter_number", None, character) or ">")
     choice = input("> ").strip()
     if not choice.isdigit():
         return False
     sel = int(choice)
-    match = next((x for x in options if x[0] == sel), None)
-    if not match:
+    if not 1 <= sel <= len(options):
         return False
-    name = match[1]
-    lname = name.lower()
-    resist = enemy_debuffs.get("spell_resistance", 0)
-
-    def apply_resist(dmg: int) -> int:
-        return max(0, dmg - resist)
-
-    if lname == "summon creature":
-        roll = roll_damage("5d4")
-        print(
-            get_dialogue("combat", "summon_attempt", None, character)
-            or f"You attempt to summon a companion... Roll {roll}"
-        )
-        ok = summon_companion(character, roll)
-        if ok:
-            character.spells[name] -= 1
-            return True
-        else:
-            return False
-    if lname == "magic missile":
-        dmg = apply_resist(max(1, roll_damage("2d6")))
-        monster.hp -= dmg
-        print(
-            get_dialogue("combat", "magic_missile", None, character)
-            or f"Magic missiles strike for {dmg} damage. Monster HP: {max(monster.hp, 0)}"
-        )
-    elif lname == "weakness":
-        enemy_debuffs["damage_penalty"] = enemy_debuffs.get("damage_penalty", 0) + 2
-        print(
-            get_dialogue("combat", "weakness_effect", None, character)
-            or "The foe looks feebler. (-2 damage this combat)"
-        )
-    elif lname == "slowness":
-        enemy_debuffs["damage_penalty"] = enemy_debuffs.get("damage_penalty", 0) + 2
-        print(
-            get_dialogue("combat", "slowness_effect", None, character)
-            or "The foe slows. (-2 damage this combat)"
-        )
-    elif lname == "lightning bolt":
-        print(
-            get_dialogue("combat", "choose_aim", None, character)
-            or "Choose power level:"
-        )
-        print(
-            get_dialogue("combat", "full_power_option", None, character)
-            or "1) Full power"
-        )
-        print(
-            get_dialogue("combat", "half_power_option", None, character)
-            or "2) Half power"
-        )
-        print(get_dialogue("system", "enter_number", None, character) or ">")
-        mode = input("> ").strip()
-        die = "6d6" if mode == "1" else "3d6"
-        dmg = apply_resist(max(1, roll_damage(die)))
-        monster.hp -= dmg
-        print(
-            get_dialogue("combat", "lightning_bolt", None, character)
-            or f"Lightning arcs for {dmg} damage. Monster HP: {max(monster.hp, 0)}"
-        )
-    elif lname == "freeze":
-        enemy_debuffs["freeze_turns"] = enemy_debuffs.get("freeze_turns", 0) + 1
-        print(
-            get_dialogue("combat", "freeze_effect", None, character)
-            or "Ice binds the monster. (It skips its next turn)"
-        )
-    elif lname == "vulnerability":
-        enemy_debuffs["ac_penalty"] = enemy_debuffs.get("ac_penalty", 0) + 2
-        print(
-            get_dialogue("combat", "vulnerability_effect", None, character)
-            or "Cracks appear in its defenses. (-2 AC this combat)"
-        )
-    elif lname == "fireball":
-        dmg = apply_resist(max(1, roll_damage("4d6")))
-        monster.hp -= dmg
-        print(
-            get_dialogue("combat", "fireball", None, character)
-            or f"Fireball explodes for {dmg} damage. Monster HP: {max(monster.hp, 0)}"
-        )
-    elif lname == "teleport to town":
-        print(
-            get_dialogue("combat", "teleport_to_town", None, character)
-            or "A portal whisks you away to town!"
-        )
-        character.spells[name] -= 1
-        raise TeleportToTown()
-    elif lname == "magic portal":
-        print(
-            get_dialogue("combat", "magic_portal", None, character)
-            or "You conjure a portal and step through to safety."
-        )
-        character.spells[name] -= 1
-        raise TeleportToTown()
-    else:
+    name = options[sel - 1]
+    handler = _SPELL_HANDLERS.get(name.lower())
+    if handler is None:
         print(
             get_dialogue("combat", "spell_fizzle", None, character)
             or "The spell fizzles..."
         )
         return False
-    character.spells[name] -= 1
-    return True
+    resist = enemy_debuffs.get("spell_resistance", 0)
+    try:
+        cast = handler(character, monster, enemy_debuffs, resist)
+    except TeleportToTown:
+        # Teleports end combat immediately but still spend the use
+        character.spells[name] -= 1
+        raise
+    if cast:
+        character.spells[name] -= 1
+    return cast
 
 
 def choose_aim_zone(character: Character = None) -> str:
@@ -396,6 +463,19 @@ def choose_defend_zone(character: Character = None) -> str:
     return _normalize_zone_input(choice)
 
 
+_ZONES = ("high", "middle", "low")
+_ZONE_LEADING_DIGIT_RE = re.compile(r"\s*([1-3])\b")
+_ZONE_ANY_DIGIT_RE = re.compile(r"([1-3])")
+_ZONE_BY_DIGIT = {"1": "high", "2": "middle", "3": "low"}
+# Synonyms in priority order: substring matches are checked high, middle, low
+_ZONE_SYNONYMS = (
+    ("high", ("high", "upper", "head", "top", "crown")),
+    ("middle", ("middle", "centre", "center", "torso", "mid", "heart")),
+    ("low", ("low", "lower", "legs", "feet", "bottom")),
+)
+_ZONE_WORDS = {word: zone for zone, words in _ZONE_SYNONYMS for word in words}
+
+
 def _normalize_zone_input(choice: str) -> str:
     """Normalize various user inputs (numbers, words, or labels) to canonical zones:
     'high', 'middle', or 'low'. Accepts numeric choices like '1'/'2'/'3', words like
@@ -403,25 +483,23 @@ def _normalize_zone_input(choice: str) -> str:
     """
     if not choice:
         return "middle"
-    import re
-
     s = choice.strip().lower()
     # If user clicked a numbered button, try to extract leading digit
-    m = re.match(r"\s*([1-3])\b", s)
+    m = _ZONE_LEADING_DIGIT_RE.match(s)
     if m:
-        map_digit = {"1": "high", "2": "middle", "3": "low"}
-        return map_digit.get(m.group(1), "middle")
+        return _ZONE_BY_DIGIT.get(m.group(1), "middle")
+    # Exact synonym (the common case) is a single dict hit
+    zone = _ZONE_WORDS.get(s)
+    if zone:
+        return zone
     # Check for common synonyms
-    if any(x in s for x in ("high", "upper", "head", "top", "crown")):
-        return "high"
-    if any(x in s for x in ("middle", "centre", "center", "torso", "mid", "heart")):
-        return "middle"
-    if any(x in s for x in ("low", "lower", "legs", "feet", "bottom")):
-        return "low"
+    for zone, words in _ZONE_SYNONYMS:
+        if any(x in s for x in words):
+            return zone
     # Also accept raw digits anywhere
-    m2 = re.search(r"([1-3])", s)
+    m2 = _ZONE_ANY_DIGIT_RE.search(s)
     if m2:
-        return {"1": "high", "2": "middle", "3": "low"}.get(m2.group(1), "middle")
+        return _ZONE_BY_DIGIT.get(m2.group(1), "middle")
     # Fallback
     return "middle"
 
@@ -430,7 +508,7 @@ def divine_assistance_combat(character: Character, monster: Monster) -> bool:
     """Divine aid: 5d4 + (WIS-10) vs 12. On success deals 3d6 or 4d6.
     NOTE: Monster ALWAYS gets to attack after, even on success (consumes your turn)."""
     wis = character.attributes.get("Wisdom", 10)
-    roll = roll_damage("5d4") + (wis - 10)
+    roll = roll_5d4() + (wis - 10)
     print(
         get_dialogue("combat", "divine_attempt", None, character)
         or f"You call for divine aid... Roll {roll}"
@@ -472,7 +550,7 @@ def apply_poison_dot(character: Character) -> None:
 
 def charm_monster(character: Character, monster: Monster) -> bool:
     cha = character.attributes.get("Charisma", 10)
-    roll = roll_damage("5d4") + cha
+    roll = roll_5d4() + cha
     raw = get_dialogue("combat", "charm_attempt", None, character)
     if raw:
         try:
@@ -500,10 +578,10 @@ def charm_monster(character: Character, monster: Monster) -> bool:
 def run_away(character: Character, monster: Monster) -> bool:
     dex = character.attributes.get("Dexterity", 10)
     # Use a simple Dexterity bonus (Dex/2 rounded up) for escape attempts so thresholds are reasonable
-    dex_bonus = math.ceil(dex / 2)
+    dex_bonus = (dex + 1) // 2
     monster_dex = getattr(monster, "dexterity", 10)
-    monster_bonus = math.ceil(monster_dex / 2)
-    attack_die = roll_damage("5d4")
+    monster_bonus = (monster_dex + 1) // 2
+    attack_die = roll_5d4()
     roll = attack_die + dex_bonus
     threshold = 15 + monster_bonus
     raw = get_dialogue("combat", "run_attempt", None, character)
@@ -536,6 +614,103 @@ def run_away(character: Character, monster: Monster) -> bool:
         return False
 
 
+def _weapon_hit_damage(weapon, strength_bonus: int, damage_bonus: int) -> int:
+    """Roll weapon damage plus bonuses; damaged weapons deal half (minimum 1)."""
+    base_dmg = roll_damage(weapon.damage_die if weapon else "1d2")
+    base_dmg += strength_bonus + damage_bonus
+    if weapon and weapon.damaged:
+        base_dmg = max(1, base_dmg // 2)
+    return max(1, base_dmg)
+
+
+def _maybe_damage_weapon(weapon, chance: float) -> None:
+    if random.random() < chance and weapon:
+        weapon.damaged = True
+        print(f"Unlucky! Your {weapon.name} is damaged and now less effective.")
+
+
+def _player_attack(
+    character: Character, monster: Monster, buffs: dict, enemy_debuffs: dict
+) -> bool:
+    """Resolve one weapon attack against the monster. Returns True if it died."""
+    zone = choose_aim_zone()
+    weapon = choose_weapon(character)
+    enemy_ac = max(1, monster.armor_class - enemy_debuffs.get("ac_penalty", 0))
+    attack_die = roll_5d4()
+    str_mod = character.attributes.get("Strength", 10)
+    attack_roll = attack_die + str_mod
+    # NEW DAMAGE FORMULA: weapon_damage + ceil(strength / 2)
+    strength_bonus = (str_mod + 1) // 2
+    # Chance to damage player's weapon when striking (0.1% per monster AC)
+    weapon_break_chance = monster.armor_class * 0.001
+    # Monster selects a defend zone (secret) to try to block your strike
+    monster_defend_zone = random.choice(_ZONES)
+    print(
+        f"You aim {zone} and roll: {attack_die} + Strength({str_mod}) = {attack_roll} vs AC {enemy_ac}"
+    )
+    print(f"The {monster.name} braces to defend {monster_defend_zone}.")
+    # Fumble on minimum roll (5 for 5d4): you injure yourself
+    if attack_die == 5:
+        self_dmg = max(1, roll_damage("1d4"))
+        character.hp -= self_dmg
+        msg = get_dialogue("combat", "natural_one_self", None, character)
+        if msg:
+            try:
+                print(msg.format(dmg=self_dmg, hp=max(character.hp, 0)))
+            except Exception:
+                print(msg)
+        else:
+            print(
+                f"Massive fail! You injure yourself for {self_dmg} HP. Your HP: {max(character.hp, 0)}"
+            )
+        return monster.hp <= 0
+    # Natural 20 always crits (ignores block)
+    if attack_die == 20:
+        # compute damage as a crit regardless of defend zone
+        dmg = _weapon_hit_damage(weapon, strength_bonus, buffs.get("damage_bonus", 0))
+        crit = int(dmg * 1.5)
+        monster.hp -= crit
+        print(f"Critical hit! You deal {crit} damage. Monster HP: {max(monster.hp, 0)}")
+        # Monster hurt reaction (player hit) - print prefixed with monster name
+        hurt = get_npc_dialogue("monster", "hurt_reaction", None, monster)
+        if hurt:
+            try:
+                text = hurt.format(name=monster.name)
+            except Exception:
+                text = hurt
+            if monster.name not in text:
+                text = f"{monster.name}: {text}"
+            print(text)
+        # On critical hits, higher chance to damage monster defenses
+        if random.random() < min(0.5, 0.005 * monster.armor_class):
+            enemy_debuffs["crippled"] = True
+            print("The blow rends the creature's defenses — it is crippled!")
+        # Chance to damage player's weapon on successful hit (0.1% per monster AC)
+        _maybe_damage_weapon(weapon, weapon_break_chance)
+        return monster.hp <= 0
+    # Perfect defense blocks even a strong hit (non-crit)
+    if monster_defend_zone == zone:
+        print(f"Your attack is blocked by the {monster_defend_zone} guard!")
+        # Even blocked (non-crit) attacks can damage equipment per new rules (chance based on monster AC)
+        _maybe_damage_weapon(weapon, weapon_break_chance)
+        return monster.hp <= 0
+    if attack_roll >= enemy_ac:
+        dmg = _weapon_hit_damage(weapon, strength_bonus, buffs.get("damage_bonus", 0))
+        # Natural 20s resolved above, so this is always a normal hit
+        monster.hp -= dmg
+        print(f"Hit! You deal {dmg} damage. Monster HP: {max(monster.hp, 0)}")
+        # Monster hurt reaction (prefixed with monster name/role)
+        hurt = get_npc_dialogue("monster", "hurt_reaction", None, monster)
+        if hurt:
+            print(hurt)
+        # Chance to damage player's weapon on successful hit (0.1% per monster AC)
+        _maybe_damage_weapon(weapon, weapon_break_chance)
+    else:
+        miss = get_dialogue("system", "tips", None, character) or "You miss!"
+        print(miss)
+    return monster.hp <= 0
+
+
 def player_turn(
     character: Character,
     monster: Monster,
@@ -592,148 +767,25 @@ def player_turn(
         examine_monster(character, monster)
         return "examine_no_turn"  # Special: examine doesn't trigger monster turn
     # Attack
-    zone = choose_aim_zone()
-    weapon = choose_weapon(character)
-    enemy_ac = max(1, monster.armor_class - enemy_debuffs.get("ac_penalty", 0))
-    attack_die = roll_damage("5d4")
-    str_mod = character.attributes.get("Strength", 10)
-    attack_roll = attack_die + str_mod
-    # Monster selects a defend zone (secret) to try to block your strike
-    monster_defend_zone = random.choice(["high", "middle", "low"])
-    print(
-        f"You aim {zone} and roll: {attack_die} + Strength({str_mod}) = {attack_roll} vs AC {enemy_ac}"
-    )
-    print(f"The {monster.name} braces to defend {monster_defend_zone}.")
-    # Fumble on minimum roll (5 for 5d4): you injure yourself
-    if attack_die == 5:
-        self_dmg = max(1, roll_damage("1d4"))
-        character.hp -= self_dmg
-        msg = get_dialogue("combat", "natural_one_self", None, character)
-        if msg:
-            try:
-                print(msg.format(dmg=self_dmg, hp=max(character.hp, 0)))
-            except Exception:
-                print(msg)
-        else:
-            print(
-                f"Massive fail! You injure yourself for {self_dmg} HP. Your HP: {max(character.hp, 0)}"
-            )
-        return monster.hp <= 0
-    # Natural 20 always crits (ignores block)
-    if attack_die == 20:
-        # compute damage as a crit regardless of defend zone
-        dmg_die = weapon.damage_die if weapon else "1d2"
-        # NEW DAMAGE FORMULA: weapon_damage + math.ceil(strength / 2)
-        strength_bonus = math.ceil(character.attributes.get("Strength", 10) / 2)
-        base_dmg = roll_damage(dmg_die) + strength_bonus + buffs.get("damage_bonus", 0)
-        if weapon and getattr(weapon, "damaged", False):
-            base_dmg = max(1, base_dmg // 2)
-        dmg = max(1, base_dmg)
-        crit = int(dmg * 1.5)
-        monster.hp -= crit
-        print(f"Critical hit! You deal {crit} damage. Monster HP: {max(monster.hp, 0)}")
-        # Monster hurt reaction (player hit) - print prefixed with monster name
-        hurt = get_npc_dialogue("monster", "hurt_reaction", None, monster)
-        if hurt:
-            try:
-                text = hurt.format(name=monster.name)
-            except Exception:
-                text = hurt
-            if monster.name not in text:
-                text = f"{monster.name}: {text}"
-            print(text)
-        # On critical hits, higher chance to damage monster defenses
-        try:
-            mc = getattr(monster, "armor_class", 10)
-            extra_chance = min(0.5, 0.005 * mc)
-            if random.random() < extra_chance:
-                enemy_debuffs["crippled"] = True
-                print("The blow rends the creature's defenses — it is crippled!")
-        except Exception:
-            pass
-        # Chance to damage player's weapon on successful hit (0.1% per monster AC)
-        try:
-            mc = getattr(monster, "armor_class", 10)
-            chance = mc * 0.001
-            if random.random() < chance and weapon:
-                weapon.damaged = True
-                print(f"Unlucky! Your {weapon.name} is damaged and now less effective.")
-        except Exception:
-            pass
-        return monster.hp <= 0
-    # Perfect defense blocks even a strong hit (non-crit)
-    if monster_defend_zone == zone:
-        print(f"Your attack is blocked by the {monster_defend_zone} guard!")
-        # Even blocked (non-crit) attacks can damage equipment per new rules (chance based on monster AC)
-        try:
-            mc = getattr(monster, "armor_class", 10)
-            chance = mc * 0.001
-            if random.random() < chance and weapon:
-                weapon.damaged = True
-                print(f"Unlucky! Your {weapon.name} is damaged and now less effective.")
-        except Exception:
-            pass
-        return monster.hp <= 0
-    if attack_roll >= enemy_ac:
-        dmg_die = weapon.damage_die if weapon else "1d2"
-        # NEW DAMAGE FORMULA: weapon_damage + math.ceil(strength / 2)
-        strength_bonus = math.ceil(character.attributes.get("Strength", 10) / 2)
-        base_dmg = roll_damage(dmg_die) + strength_bonus + buffs.get("damage_bonus", 0)
-        # Apply damaged weapon reduction (damaged weapons do half damage)
-        if weapon and getattr(weapon, "damaged", False):
-            base_dmg = max(1, base_dmg // 2)
-        dmg = max(1, base_dmg)
-        # Handle criticals vs normal hits
-        if attack_die == 20:
-            crit = int(dmg * 1.5)
-            monster.hp -= crit
-            print(
-                f"Critical hit! You deal {crit} damage. Monster HP: {max(monster.hp, 0)}"
-            )
-            # Monster hurt reaction (prefixed with monster name/role)
-            hurt = get_npc_dialogue("monster", "hurt_reaction", None, monster)
-            if hurt:
-                try:
-                    text = hurt.format(name=monster.name)
-                except Exception:
-                    text = hurt
-                if monster.name not in text:
-                    text = f"{monster.name}: {text}"
-                print(text)
-            # On critical hits, higher chance to damage monster defenses
-            try:
-                mc = getattr(monster, "armor_class", 10)
-                extra_chance = min(0.5, 0.005 * mc)
-                if random.random() < extra_chance:
-                    enemy_debuffs["crippled"] = True
-                    print("The blow rends the creature's defenses — it is crippled!")
-            except Exception:
-                pass
-        else:
-            # Normal hit
-            monster.hp -= dmg
-            print(f"Hit! You deal {dmg} damage. Monster HP: {max(monster.hp, 0)}")
-            # Monster hurt reaction (prefixed with monster name/role)
-            hurt = get_npc_dialogue("monster", "hurt_reaction", None, monster)
-            if hurt:
-                print(hurt)
-        # Chance to damage player's weapon on successful hit (0.1% per monster AC)
-        try:
-            mc = getattr(monster, "armor_class", 10)
-            chance = mc * 0.001
-            if random.random() < chance and weapon:
-                weapon.damaged = True
-                print(f"Unlucky! Your {weapon.name} is damaged and now less effective.")
-        except Exception:
-            pass
-    else:
-        miss = get_dialogue("system", "tips", None, character) or "You miss!"
-        print(miss)
-    if buffs.get("extra_attack_charges", 0) > 0 and monster.hp > 0 and choice == "1":
+    defeated = _player_attack(character, monster, buffs, enemy_debuffs)
+    while (
+        choice == "1"
+        and buffs.get("extra_attack_charges", 0) > 0
+        and monster.hp > 0
+        and character.hp > 0
+    ):
         buffs["extra_attack_charges"] -= 1
         print("Your speed grants you an extra strike!")
-        return player_turn(character, monster, buffs, enemy_debuffs)
-    return monster.hp <= 0
+        defeated = _player_attack(character, monster, buffs, enemy_debuffs)
+    return defeated
+
+
+def _maybe_damage_armor(character: Character, chance: float) -> None:
+    if random.random() < chance and character.armor:
+        character.armor.damaged = True
+        print(
+            f"Ouch! Your {character.armor.name} is damaged and provides reduced protection."
+        )
 
 
 def monster_turn(
@@ -748,25 +800,27 @@ def monster_turn(
         print("The monster swings wildly but hits nothing!")
         return False
     # Monster prepares an unseen strike: choose attack zone (hidden)
-    monster_zone = random.choice(["high", "middle", "low"])
+    monster_zone = random.choice(_ZONES)
     # Player chooses where to defend
     print("Prepare your guard before the attack lands.")
     player_defend_zone = choose_defend_zone()
     print(f"You brace to defend {player_defend_zone}.")
     # Roll attack
     ac = compute_armor_class(character, buffs.get("ac_bonus", 0))
-    attack_die = roll_damage("5d4")
+    attack_die = roll_5d4()
     monster_strength = getattr(monster, "strength", 10)
     strength_bonus = monster_strength // 2
     attack_roll = attack_die + strength_bonus
     print(
         f"{monster.name} attacks {monster_zone}: roll {attack_die} + Strength/2({strength_bonus}) = {attack_roll} vs AC {ac}"
     )
+    damage_die = monster.damage_die
+    damage_penalty = enemy_debuffs.get("damage_penalty", 0)
+    # Chance to damage player's armor when struck (0.1% per monster strength)
+    armor_break_chance = monster_strength * 0.001
     # Fumble on minimum roll (5 for 5d4): monster injures itself
     if attack_die == 5:
-        self_dmg = max(
-            1, roll_damage(monster.damage_die) - enemy_debuffs.get("damage_penalty", 0)
-        )
+        self_dmg = max(1, roll_damage(damage_die) - damage_penalty)
         monster.hp -= self_dmg
         msg = get_dialogue("combat", "monster_natural_one", None, character)
         if msg:
@@ -779,57 +833,26 @@ def monster_turn(
         return character.hp <= 0
     # Natural 20: monster critical hit (ignores defend zone)
     if attack_die == 20:
-        dmg = max(
-            1, roll_damage(monster.damage_die) - enemy_debuffs.get("damage_penalty", 0)
-        )
+        dmg = max(1, roll_damage(damage_die) - damage_penalty)
         crit = int(dmg * 1.5)
         character.hp -= crit
         print(f"Critical hit! You take {crit} damage. Your HP: {max(character.hp, 0)}")
         # Chance to damage player's armor on successful monster hit (0.1% per monster strength)
-        try:
-            ms = getattr(monster, "strength", getattr(monster, "base_strength", 10))
-            chance = ms * 0.001
-            if random.random() < chance and character.armor:
-                character.armor.damaged = True
-                print(
-                    f"Ouch! Your {character.armor.name} is damaged and provides reduced protection."
-                )
-        except Exception:
-            pass
+        _maybe_damage_armor(character, armor_break_chance)
         return character.hp <= 0
     # Perfect defense blocks regardless of roll (non-crit)
     if player_defend_zone == monster_zone:
         print(f"You successfully defend against the {monster_zone} attack!")
         # Blocked attacks still can damage armor per new rules
-        try:
-            ms = getattr(monster, "strength", getattr(monster, "base_strength", 10))
-            chance = ms * 0.001
-            if random.random() < chance and character.armor:
-                character.armor.damaged = True
-                print(
-                    f"Ouch! Your {character.armor.name} is damaged and provides reduced protection."
-                )
-        except Exception:
-            pass
+        _maybe_damage_armor(character, armor_break_chance)
         return character.hp <= 0
     # Otherwise resolve normally against AC
     if attack_roll >= ac:
-        dmg = max(
-            1, roll_damage(monster.damage_die) - enemy_debuffs.get("damage_penalty", 0)
-        )
+        dmg = max(1, roll_damage(damage_die) - damage_penalty)
         character.hp -= dmg
         print(f"You are hit for {dmg} damage. Your HP: {max(character.hp, 0)}")
         # Chance to damage player's armor on successful monster hit (0.1% per monster strength)
-        try:
-            ms = getattr(monster, "strength", getattr(monster, "base_strength", 10))
-            chance = ms * 0.001
-            if random.random() < chance and character.armor:
-                character.armor.damaged = True
-                print(
-                    f"Ouch! Your {character.armor.name} is damaged and provides reduced protection."
-                )
-        except Exception:
-            pass
+        _maybe_damage_armor(character, armor_break_chance)
     else:
         print(f"{monster.name} misses!")
     return character.hp <= 0
@@ -838,8 +861,8 @@ def monster_turn(
 def initiative_order(character: Character, monster: Monster) -> str:
     cdx = character.attributes.get("Dexterity", 10)
     mdx = getattr(monster, "dexterity", 10)
-    c_roll = roll_damage("5d4") + cdx
-    m_roll = roll_damage("5d4") + mdx
+    c_roll = roll_5d4() + cdx
+    m_roll = roll_5d4() + mdx
     print(
         f"Initiative - You: {c_roll} (roll + {cdx}) vs Monster: {m_roll} (roll + {mdx})"
     )
@@ -874,36 +897,27 @@ def combat_encounter(character: Character, monster: Monster) -> tuple[bool, str]
     examine_used = False  # Track if examine has been used this combat
     turn = initiative_order(character, monster)
     while character.hp > 0 and monster.hp > 0:
-        try:
-            if turn == "player":
-                result = player_turn(
-                    character, monster, buffs, enemy_debuffs, examine_used
-                )
-                if result == "charmed":
-                    return True, "charmed"
-                elif result == "escaped":
-                    return True, "escaped"
-                elif result == "examine_no_turn":
-                    # Examine doesn't trigger monster turn, stay on player turn
-                    examine_used = True
-                    continue
-                elif result:
-                    # Monster defeated
-                    pass
-                # Companion acts after player
-                if (
-                    character.companion
-                    and character.companion.hp > 0
-                    and monster.hp > 0
-                ):
-                    companion_turn(character, monster)
-                turn = "monster"
-            else:
-                if monster_turn(character, monster, buffs, enemy_debuffs):
-                    pass
-                turn = "player"
-        except TeleportToTown:
-            raise
+        if turn == "player":
+            # TeleportToTown raised by a spell propagates to the caller
+            result = player_turn(character, monster, buffs, enemy_debuffs, examine_used)
+            if result == "charmed":
+                return True, "charmed"
+            elif result == "escaped":
+                return True, "escaped"
+            elif result == "examine_no_turn":
+                # Examine doesn't trigger monster turn, stay on player turn
+                examine_used = True
+                continue
+            elif result:
+                # Monster defeated
+                pass
+            # Companion acts after player
+            if character.companion and character.companion.hp > 0 and monster.hp > 0:
+                companion_turn(character, monster)
+            turn = "monster"
+        else:
+            monster_turn(character, monster, buffs, enemy_debuffs)
+            turn = "player"
         if monster.hp <= 0 or character.hp <= 0:
             break
 
@@ -1,110 +1,69 @@
 from __future__ import annotations
 
+import bisect
 import random
 from dataclasses import dataclass
+from typing import List, Tuple
 
-from .dice import roll_damage
+from .dice import roll_d20, roll_damage
 from .entities import Character, Companion, Monster
 from .data_loader import get_dialogue
 
 
-SUMMON_TABLE = [
+@dataclass(frozen=True, slots=True)
+class SummonEntry:
+    species: str
+    damage_die: str
+    ac_range: Tuple[int, int]
+    str_range: Tuple[int, int]
+    hp_range: Tuple[int, int]
+    min_roll: int
+
+
+SUMMON_TABLE = (
     # High tier (needs 16+)
-    {
-        "species": "Lion",
-        "damage_die": "4d6",
-        "ac_range": (12, 14),
-        "str_range": (12, 15),
-        "hp_range": (50, 75),
-        "min_roll": 16,
-    },
-    {
-        "species": "Bear",
-        "damage_die": "4d6",
-        "ac_range": (12, 14),
-        "str_range": (12, 15),
-        "hp_range": (50, 75),
-        "min_roll": 16,
-    },
-    {
-        "species": "Tiger",
-        "damage_die": "4d6",
-        "ac_range": (12, 14),
-        "str_range": (12, 15),
-        "hp_range": (50, 75),
-        "min_roll": 16,
-    },
+    SummonEntry("Lion", "4d6", (12, 14), (12, 15), (50, 75), 16),
+    SummonEntry("Bear", "4d6", (12, 14), (12, 15), (50, 75), 16),
+    SummonEntry("Tiger", "4d6", (12, 14), (12, 15), (50, 75), 16),
     # Mid tier (12-15)
-    {
-        "species": "Wolf",
-        "damage_die": "3d6",
-        "ac_range": (10, 12),
-        "str_range": (10, 12),
-        "hp_range": (30, 50),
-        "min_roll": 12,
-    },
-    {
-        "species": "Panther",
-        "damage_die": "3d6",
-        "ac_range": (10, 12),
-        "str_range": (10, 12),
-        "hp_range": (30, 50),
-        "min_roll": 12,
-    },
-    {
-        "species": "Eagle",
-        "damage_die": "3d6",
-        "ac_range": (10, 12),
-        "str_range": (10, 12),
-        "hp_range": (30, 50),
-        "min_roll": 12,
-    },
+    SummonEntry("Wolf", "3d6", (10, 12), (10, 12), (30, 50), 12),
+    SummonEntry("Panther", "3d6", (10, 12), (10, 12), (30, 50), 12),
+    SummonEntry("Eagle", "3d6", (10, 12), (10, 12), (30, 50), 12),
     # Low tier (8-11)
-    {
-        "species": "Dog",
-        "damage_die": "2d6",
-        "ac_range": (8, 10),
-        "str_range": (8, 10),
-        "hp_range": (15, 30),
-        "min_roll": 8,
-    },
-    {
-        "species": "Cat",
-        "damage_die": "2d6",
-        "ac_range": (8, 10),
-        "str_range": (8, 10),
-        "hp_range": (15, 30),
-        "min_roll": 8,
-    },
-    {
-        "species": "Owl",
-        "damage_die": "2d6",
-        "ac_range": (8, 10),
-        "str_range": (8, 10),
-        "hp_range": (15, 30),
-        "min_roll": 8,
-    },
-]
+    SummonEntry("Dog", "2d6", (8, 10), (8, 10), (15, 30), 8),
+    SummonEntry("Cat", "2d6", (8, 10), (8, 10), (15, 30), 8),
+    SummonEntry("Owl", "2d6", (8, 10), (8, 10), (15, 30), 8),
+)
+
+
+# Summon tiers in ascending min_roll order, with each tier's entries in table order
+_TIER_THRESHOLDS = sorted({e.min_roll for e in SUMMON_TABLE})
+_TIER_BUCKETS = [[e for e in SUMMON_TABLE if e.min_roll == t] for t in _TIER_THRESHOLDS]
+
+
+def summon_candidates(final_roll: int) -> List[SummonEntry]:
+    """Return the entries of the highest tier final_roll reaches (empty if none)."""
+    idx = bisect.bisect_right(_TIER_THRESHOLDS, final_roll) - 1
+    return _TIER_BUCKETS[idx] if idx >= 0 else []
 
 
 def roll_range(lo: int, hi: int) -> int:
     return random.randint(lo, hi)
 
 
-def create_companion_from_entry(entry: dict) -> Companion:
-    ac = roll_range(*entry["ac_range"])
-    hp = roll_range(*entry["hp_range"])
-    # Roll a strength value from the entry's str_range if present
-
-    str_val = roll_range(*entry["str_range"])
+def create_companion_from_entry(entry: SummonEntry) -> Companion:
+    ac = roll_range(*entry.ac_range)
+    hp = roll_range(*entry.hp_range)
+    # Roll a strength value from the entry's str_range
+    str_val = roll_range(*entry.str_range)
 
     return Companion(
-        name=entry["species"],
-        species=entry["species"],
+        name=entry.species,
+        species=entry.species,
         hp=hp,
         max_hp=hp,
         armor_class=ac,
-        damage_die=entry["damage_die"],
+        damage_die=entry.damage_die,
         strength=str_val,
     )
 
@@ -146,9 +105,9 @@ def summon_companion(character: Character, roll_value: int) -> bool:
             f"You rolled {roll_value}. Bonus from Int+Cha: {bonus}. Final roll: {final_roll}."
         )
 
-    # Filter entries that meet the min_roll threshold using the final roll
-    eligible = [e for e in SUMMON_TABLE if final_roll >= e["min_roll"]]
-    if not eligible:
+    # Highest tier whose min_roll the final roll meets
+    candidates = summon_candidates(final_roll)
+    if not candidates:
         # Low final roll -> summoning fails (no familiar fallback)
         print(
             get_dialogue("companion", "summon_fail", None, character)
@@ -156,9 +115,6 @@ def summon_companion(character: Character, roll_value: int) -> bool:
         )
         return False
 
-    # Prefer highest min_roll not exceeding final_roll
-    best_min = max(e["min_roll"] for e in eligible)
-    candidates = [e for e in eligible if e["min_roll"] == best_min]
     entry = random.choice(candidates)
     character.companion = create_companion_from_entry(entry)
     # Use dialogue template if available
@@ -185,7 +141,7 @@ def companion_turn(character: Character, monster: Monster) -> None:
     # attack overcomes the monster's AC. If (damage_roll + strength) > monster AC,
     # the attack hits and deals the damage_roll amount.
     damage_roll = max(1, roll_damage(comp.damage_die))
-    attack_value = random.randint(1, 20) + getattr(comp, "strength", 0)
+    attack_value = roll_d20() + getattr(comp, "strength", 0)
     if attack_value > monster.armor_class:
         monster.hp -= damage_roll
         hp_text = max(monster.hp, 0)
@@ -1,5 +1,8 @@
+import functools
 import json
 import os
+import random
+from dataclasses import dataclass
 from typing import Any, List, Union, Optional
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
@@ -13,14 +16,19 @@ def _read_json(filename: str) -> Any:
         return json.load(f)
 
 
+# Static data files are parsed once per process. Callers share the returned
+# lists/dicts and must treat them as read-only (copy before mutating).
+@functools.lru_cache(maxsize=1)
 def load_weapons() -> List[dict]:
     return _read_json("weapons.json")
 
 
+@functools.lru_cache(maxsize=1)
 def load_armors() -> List[dict]:
     return _read_json("armors.json")
 
 
+@functools.lru_cache(maxsize=1)
 def load_monsters() -> List[dict]:
     return _read_json("monsters.json")
 
@@ -29,26 +37,52 @@ def load_classes() -> List[dict]:
     return _read_json("classes.json")
 
 
+@functools.lru_cache(maxsize=1)
 def load_spells() -> List[dict]:
     return _read_json("spells.json")
 
 
+@functools.lru_cache(maxsize=1)
 def load_potions() -> List[dict]:
     return _read_json("potions.json")
 
 
+@functools.lru_cache(maxsize=1)
 def load_monster_sounds() -> List[dict]:
     return _read_json("monster_sounds.json")
 
 
+@functools.lru_cache(maxsize=1)
+def monster_index() -> dict:
+    """Return a mapping of monster name -> monster entry from monsters.json.
+
+    Built once per process; treat the returned dict and entries as read-only.
+    """
+    return {m.get("name"): m for m in load_monsters() or [] if m.get("name")}
+
+
+@functools.lru_cache(maxsize=1)
+def monster_sound_index() -> dict:
+    """Return a mapping of lower-cased monster name -> sound hint.
+
+    Built once per process; treat the returned dict as read-only.
+    """
+    return {
+        (s.get("name", "") or "").lower(): s.get("sound", "Unknown")
+        for s in load_monster_sounds() or []
+    }
+
+
 def load_traps() -> List[dict]:
     return _read_json("traps.json")
 
 
+@functools.lru_cache(maxsize=1)
 def load_magic_items() -> List[dict]:
     return _read_json("magic_items.json")
 
 
+@functools.lru_cache(maxsize=1)
 def load_monster_descriptions() -> dict:
     """Load monster text descriptions from data/monsters_desc.json.
 
@@ -57,6 +91,26 @@ def load_monster_descriptions() -> dict:
     return _read_json("monsters_desc.json")
 
 
+@functools.lru_cache(maxsize=1)
+def monster_description_index() -> dict:
+    """Return a mapping of lower-cased monster name -> description string.
+
+    Built once per process; treat the returned dict as read-only.
+    """
+    descs = load_monster_descriptions()
+    if not isinstance(descs, dict):
+        return {}
+    return {str(name).lower(): desc for name, desc in descs.items()}
+
+
+def get_monster_description(name) -> str:
+    """Return the description for a monster name, ignoring case, or ""."""
+    if not name:
+        return ""
+    return monster_description_index().get(str(name).lower(), "")
+
+
+@functools.lru_cache(maxsize=1)
 def load_dialogues() -> dict:
     """Load dialogues JSON as a dictionary.
 
@@ -66,6 +120,110 @@ def load_dialogues() -> dict:
     return _read_json("dialogues.json")
 
 
+def _dialogue_choices(value):
+    """Return the sequence get_dialogue() picks from for a node entry, or None.
+
+    Nested dicts resolve to their 'dialogues' list or first non-empty list
+    (or [""] when they hold none); scalars become a one-item list.
+    """
+    if not value:
+        return None
+    if isinstance(value, dict):
+        if value.get("dialogues"):
+            return value.get("dialogues")
+        for v in value.values():
+            if isinstance(v, list) and v:
+                return v
+        return [""]
+    if isinstance(value, list):
+        return value
+    return [str(value)]
+
+
+def _has_cursed_item(character) -> bool:
+    # Support both dicts and MagicItem objects
+    items = getattr(character, "magic_items", None)
+    return bool(items) and any(
+        getattr(mi, "cursed", False) or (isinstance(mi, dict) and mi.get("cursed"))
+        for mi in items
+    )
+
+
+def _is_drunk(character) -> bool:
+    # Uses a persistent buff flag - only if the object has persistent_buffs
+    buffs = getattr(character, "persistent_buffs", None)
+    return buffs is not None and buffs.get("debuff_drunk", 0) > 0
+
+
+def _charisma(character) -> int:
+    # Determine charisma safely for both Character objects and other entities
+    try:
+        attrs = getattr(character, "attributes", None)
+        if isinstance(attrs, dict):
+            return int(attrs.get("Charisma", 10))
+        return int(getattr(character, "Charisma", 10))
+    except Exception:
+        return 10
+
+
+# Character-derived conditions in priority order; the first one present in the
+# node whose check passes is used.
+_CONDITION_CHECKS = (
+    ("no_gold", lambda c: getattr(c, "gold", 0) <= 0),
+    ("full_health", lambda c: getattr(c, "hp", 0) >= getattr(c, "max_hp", 0)),
+    ("cursed", _has_cursed_item),
+    ("too_drunk", _is_drunk),
+    ("no_companion", lambda c: not getattr(c, "companion", None)),
+)
+# Charisma variants (user requested >15 or <5), checked against the charisma score
+_CHARISMA_CHECKS = (
+    ("charisma_high", lambda cha: cha > 15),
+    ("charisma_low", lambda cha: cha < 5),
+)
+
+
+@dataclass(slots=True)
+class _CompiledDialogue:
+    node: dict  # raw node, for condition membership and name/role lookups
+    conditions: dict  # entry key -> choices (see _dialogue_choices)
+    fallback: Optional[list]  # 'dialogues' list or first non-empty list value
+    checks: tuple  # the _CONDITION_CHECKS entries this node has
+    charisma_checks: tuple  # the _CHARISMA_CHECKS entries this node has
+
+
+@functools.lru_cache(maxsize=1)
+def _dialogue_index() -> dict:
+    """Return {(namespace, key): _CompiledDialogue} built from dialogues.json."""
+    data = load_dialogues()
+    index = {}
+    if not isinstance(data, dict):
+        return index
+    for namespace, ns in data.items():
+        if not isinstance(ns, dict):
+            continue
+        for key, node in ns.items():
+            if not node or not isinstance(node, dict):
+                continue
+            fallback = node.get("dialogues") or next(
+                (v for v in node.values() if isinstance(v, list) and v), None
+            )
+            conditions = {k: _dialogue_choices(v) for k, v in node.items()}
+            index[(namespace, key)] = _CompiledDialogue(
+                node,
+                conditions,
+                fallback,
+                tuple(c for c in _CONDITION_CHECKS if c[0] in node),
+                tuple(c for c in _CHARISMA_CHECKS if c[0] in node),
+            )
+    return index
+
+
+@functools.lru_cache(maxsize=1)
+def load_npc_names() -> dict:
+    """Load the role -> NPC display name mapping from data/npc_names.json."""
+    return _read_json("npc_names.json") or {}
+
+
 def get_dialogue(
     namespace: str, key: str, condition: Optional[str] = None, character=None
 ) -> str:
@@ -80,94 +238,47 @@ def get_dialogue(
     Behavior: prefer condition-specific lists if present. Falls back to the
     generic 'dialogues' list. Returns an empty string if nothing found.
     """
-    import random
-
-    data = load_dialogues()
-    ns = data.get(namespace, {}) if isinstance(data, dict) else {}
-    node = ns.get(key, {}) if isinstance(ns, dict) else {}
-    if not node:
+    compiled = _dialogue_index().get((namespace, key))
+    if compiled is None:
         return ""
     # Resolve a few common conditions from the character context when not provided
     if condition is None and character is not None:
-        # gold check
-        if getattr(character, "gold", 0) <= 0 and "no_gold" in node:
-            condition = "no_gold"
-        # full health
-        elif (
-            getattr(character, "hp", 0) >= getattr(character, "max_hp", 0)
-            and "full_health" in node
-        ):
-            condition = "full_health"
-        # cursed (support both dicts and MagicItem objects)
-        elif (
-            getattr(character, "magic_items", None)
-            and any(
-                getattr(mi, "cursed", False)
-                or (isinstance(mi, dict) and mi.get("cursed"))
-                for mi in getattr(character, "magic_items", [])
-            )
-            and "cursed" in node
-        ):
-            condition = "cursed"
-        # too drunk (uses a persistent buff flag) - only if the object has persistent_buffs
-        elif (
-            hasattr(character, "persistent_buffs")
-            and getattr(character, "persistent_buffs", {}).get("debuff_drunk", 0) > 0
-            and "too_drunk" in node
-        ):
-            condition = "too_drunk"
-        # no companion
-        elif (not getattr(character, "companion", None)) and "no_companion" in node:
-            condition = "no_companion"
-
-        # Charisma-based variants: prefer high/low charisma keys when available
-        # Determine charisma safely for both Character objects and other entities
-        try:
-            if hasattr(character, "attributes") and isinstance(
-                getattr(character, "attributes", None), dict
-            ):
-                cha = int(character.attributes.get("Charisma", 10))
-            else:
-                cha = int(getattr(character, "Charisma", 10))
-        except Exception:
-            cha = 10
-        # user requested >15 or <5
-        if cha > 15 and "charisma_high" in node:
-            condition = "charisma_high"
-        elif cha < 5 and "charisma_low" in node:
-            condition = "charisma_low"
+        for name, check in compiled.checks:
+            if check(character):
+                condition = name
+                break
+        # Charisma-based variants override the above when the node has them
+        if compiled.charisma_checks:
+            cha = _charisma(character)
+            for name, check in compiled.charisma_checks:
+                if check(cha):
+                    condition = name
+                    break
 
     # Prefer condition-specific list when available
-    if condition and condition in node and node.get(condition):
-        sub = node.get(condition)
-        # If the condition resolves to a nested node (dict), try to pick
-        # from its 'dialogues' list or any list field inside it.
-        if isinstance(sub, dict):
-            if sub.get("dialogues"):
-                return random.choice(sub.get("dialogues"))
-            for v in sub.values():
-                if isinstance(v, list) and v:
-                    return random.choice(v)
-            # If it's a dict with no list to pick, fall through to empty string
-            return ""
-        # If it's a plain list, pick from it
-        if isinstance(sub, list):
-            return random.choice(sub)
-        # Otherwise coerce to string
-        return str(sub)
-
-    # Fallback to generic dialogues
-    if node.get("dialogues"):
-        return random.choice(node.get("dialogues"))
-
-    # As a last resort, try any list value present
-    for v in node.values():
-        if isinstance(v, list) and v:
-            return random.choice(v)
+    choices = compiled.conditions.get(condition) if condition else None
+    if choices:
+        return random.choice(choices)
+
+    # Fallback to generic dialogues, or as a last resort any list value present
+    if compiled.fallback:
+        return random.choice(compiled.fallback)
 
     return ""
 
 
+def get_dialogue_lines(namespace: str, key: str) -> list:
+    """Return a node's full 'dialogues' list in order, or [] if it has none.
+
+    Used for multi-line passages (story intro, startup text) that are shown in
+    full rather than sampled. The list is shared cached data; do not mutate it.
+    """
+    compiled = _dialogue_index().get((namespace, key))
+    if compiled is None:
+        return []
+    return compiled.node.get("dialogues") or []
+
+
 def get_npc_dialogue(
     namespace: str, key: str, condition: Optional[str] = None, character=None
 ) -> str:
@@ -184,9 +295,8 @@ def get_npc_dialogue(
     if not text:
         return ""
     # Try to obtain the node's name/role from the dialogues JSON so we can prefix it
-    data = load_dialogues()
-    ns = data.get(namespace, {}) if isinstance(data, dict) else {}
-    node = ns.get(key, {}) if isinstance(ns, dict) else {}
+    compiled = _dialogue_index().get((namespace, key))
+    node = compiled.node if compiled is not None else {}
 
     # Avoid prefixing obvious headers/system nodes
     node_name = node.get("name") or ""
@@ -208,7 +318,7 @@ def get_npc_dialogue(
         return text
 
     # Load role -> NPC display name mapping from data/npc_names.json (if present)
-    npc_map = _read_json("npc_names.json") or {}
+    npc_map = load_npc_names()
     display_name = None
     # Prefer a human name only when it's not just a generic node title that
     # includes the role (e.g. 'Shopkeeper Sell'). If the node's name contains the
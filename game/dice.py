@@ -1,7 +1,9 @@
+import functools
 import random
 from typing import Tuple
 
 
+@functools.lru_cache(maxsize=128)
 def parse_die(notation: str) -> Tuple[int, int]:
 	# format NdM, e.g., 2d6
 	n_str, d_str = notation.lower().split('d')
@@ -12,12 +14,27 @@ def parse_die(notation: str) -> Tuple[int, int]:
 
 def roll(notation: str) -> int:
 	num, sides = parse_die(notation)
-	return sum(random.randint(1, sides) for _ in range(num))
+	# One choices() call draws every face instead of a randint() per die
+	return sum(random.choices(range(1, sides + 1), k=num))
+
+
+def roll_5d4() -> int:
+	# Five d4 faces from one 10-bit draw (2 bits per die); same distribution as roll("5d4")
+	bits = random.getrandbits(10)
+	return (
+		5
+		+ (bits & 3)
+		+ ((bits >> 2) & 3)
+		+ ((bits >> 4) & 3)
+		+ ((bits >> 6) & 3)
+		+ ((bits >> 8) & 3)
+	)
 
 
 def roll_d20() -> int:
-	return random.randint(1, 20)
+	# Scaled random() float, as random.choices does; skips randint's range checks and rejection loop
+	return int(random.random() * 20) + 1
 
 
-def roll_damage(die: str) -> int:
-	return roll(die)
+# Damage rolls use the same NdM notation; alias rather than wrap
+roll_damage = roll
@@ -29,20 +29,34 @@ from dataclasses import dataclass, field, asdict
 from typing import Any, Dict, List, Optional, Tuple
 import random
 import math
+import sys
 
 from .entities import Character, Monster
-from .dice import roll_damage
-from .combat import compute_armor_class, wisdom_bonus
-from .labyrinth import generate_room
+from .dice import roll_5d4, roll_d20, roll_damage
+from .combat import _ZONES, compute_armor_class, wisdom_bonus
+from .companion import create_companion_from_entry, summon_candidates
+from .labyrinth import _monster_by_name, generate_room, peek_next_monster
 from .data_loader import (
     get_dialogue,
-    load_dialogues,
+    get_dialogue_lines,
+    get_monster_description,
+    get_npc_dialogue,
+    load_magic_items,
     load_weapons,
     load_armors,
     load_potions,
     load_spells,
+    monster_index,
+    monster_sound_index,
 )
 from .traps import random_room_trap, resolve_trap_events
+from .scene_manager import (
+    set_death_background,
+    set_labyrinth_background,
+    set_monster_background,
+    set_room_background,
+    set_town_background,
+)
 
 
 # ---------- Event and Engine State ----------
@@ -139,8 +153,6 @@ class GameEngine:
         self._emit_clear()
         # Show labyrinth background on main menu
         try:
-            from .scene_manager import set_labyrinth_background
-
             ev = set_labyrinth_background()
             bg = ev.get("data", {}).get("background") if isinstance(ev, dict) else None
             if bg:
@@ -216,8 +228,6 @@ class GameEngine:
     def handle_action(
         self, action: str, payload: Optional[Dict[str, Any]] = None
     ) -> List[Event]:
-        import sys
-
         if self.debug:
             print(f"\n{'='*60}")
             print("[ENGINE] handle_action called")
@@ -276,8 +286,6 @@ class GameEngine:
                 self._emit_clear()
                 # Ensure labyrinth background is set at the start of character creation
                 try:
-                    from .scene_manager import set_labyrinth_background
-
                     ev = set_labyrinth_background()
                     bg = (
                         ev.get("data", {}).get("background")
@@ -291,14 +299,7 @@ class GameEngine:
                 except Exception:
                     self._emit_scene("labyrinth.png")
                 try:
-                    d = load_dialogues() or {}
-                    sysd = d.get("system", {}) if isinstance(d, dict) else {}
-                    story = []
-                    if isinstance(sysd.get("story_intro", {}), dict):
-                        story = list(
-                            sysd.get("story_intro", {}).get("dialogues", []) or []
-                        )
-                    for line in story:
+                    for line in get_dialogue_lines("system", "story_intro"):
                         if line:
                             self._emit_dialogue(line)
                 except Exception:
@@ -362,14 +363,7 @@ class GameEngine:
                 # Stage 2: Show full startup
                 self._emit_clear()
                 try:
-                    d = load_dialogues() or {}
-                    sysd = d.get("system", {}) if isinstance(d, dict) else {}
-                    startup = []
-                    if isinstance(sysd.get("startup", {}), dict):
-                        startup = list(
-                            sysd.get("startup", {}).get("dialogues", []) or []
-                        )
-                    for line in startup:
+                    for line in get_dialogue_lines("system", "startup"):
                         if line:
                             self._emit_dialogue(line)
                 except Exception:
@@ -396,8 +390,6 @@ class GameEngine:
             self._emit_clear()
             # Keep labyrinth background while reading
             try:
-                from .scene_manager import set_labyrinth_background
-
                 ev = set_labyrinth_background()
                 bg = (
                     ev.get("data", {}).get("background")
@@ -430,8 +422,6 @@ class GameEngine:
             self._emit_clear()
             # Set labyrinth background again for consistency
             try:
-                from .scene_manager import set_labyrinth_background
-
                 ev = set_labyrinth_background()
                 bg = (
                     ev.get("data", {}).get("background")
@@ -470,8 +460,6 @@ class GameEngine:
         elif action == "main:quit":
             # On quit, reset background to labyrinth
             try:
-                from .scene_manager import set_labyrinth_background
-
                 ev = set_labyrinth_background()
                 bg = (
                     ev.get("data", {}).get("background")
@@ -701,7 +689,7 @@ class GameEngine:
                 or "Rolling 5d4 for HP bonus..."
             )
             base_hp = 3 * con
-            hp_bonus = roll_damage("5d4")
+            hp_bonus = roll_5d4()
             hp = base_hp + hp_bonus
             try:
                 self._emit_dialogue(
@@ -811,14 +799,8 @@ class GameEngine:
             gold = c.gold if c else 0
             # Prefer 'Name' variant explicitly if present
             try:
-                d = load_dialogues() or {}
-                sysd = d.get("system", {}) if isinstance(d, dict) else {}
-                node = (
-                    sysd.get("creation_name_line", {}) if isinstance(sysd, dict) else {}
-                )
-                choices = node.get("dialogues", []) if isinstance(node, dict) else []
                 pref = None
-                for t in choices or []:
+                for t in get_dialogue_lines("system", "creation_name_line"):
                     if isinstance(t, str) and t.strip().lower().startswith("name"):
                         pref = t
                         break
@@ -853,8 +835,6 @@ class GameEngine:
             self._emit_clear()
             # Set town background (new path via scene manager)
             try:
-                from .scene_manager import set_town_background
-
                 ev = set_town_background()
                 bg = (
                     ev.get("data", {}).get("background")
@@ -1119,7 +1099,7 @@ class GameEngine:
                     pass
                 self._emit_update_stats()
                 con = int(getattr(c, "attributes", {}).get("Constitution", 10))
-                roll_total = roll_damage("5d4") + con
+                roll_total = roll_5d4() + con
                 try:
                     self._emit_dialogue(f"Rest check: Roll {roll_total} (need >25)")
                 except Exception:
@@ -1167,8 +1147,6 @@ class GameEngine:
                 except Exception:
                     pass
             else:
-                from .data_loader import get_npc_dialogue
-
                 self._emit_dialogue(
                     get_npc_dialogue("town", "healer_elwen", None, c)
                     or "Sister Elwen: The townsfolk heal your wounds and cleanse harmful effects."
@@ -1218,8 +1196,6 @@ class GameEngine:
                 except Exception:
                     pass
             else:
-                from .data_loader import get_npc_dialogue
-
                 cook = get_npc_dialogue("town", "cook_hera", None, c)
                 cook_name = cook.split(":", 1)[0] if cook else "Hera"
                 meal = (
@@ -1241,7 +1217,7 @@ class GameEngine:
                     cha = int(getattr(c, "attributes", {}).get("Charisma", 10))
                 except Exception:
                     cha = 10
-                roll_total = roll_damage("5d4") + cha
+                roll_total = roll_5d4() + cha
                 try:
                     self._emit_dialogue(f"{cook_name}: Roll {roll_total} (need >25)")
                 except Exception:
@@ -1298,8 +1274,6 @@ class GameEngine:
                 except Exception:
                     pass
             else:
-                from .data_loader import get_npc_dialogue
-
                 bark = get_npc_dialogue("town", "bartender_roth", None, c)
                 bark_name = bark.split(":", 1)[0] if bark else "Roth"
                 # CHA-based check: 5d4 + CHA > 25 => heal ceil(maxHP/3)
@@ -1307,7 +1281,7 @@ class GameEngine:
                     cha = int(getattr(c, "attributes", {}).get("Charisma", 10))
                 except Exception:
                     cha = 10
-                roll_total = roll_damage("5d4") + cha
+                roll_total = roll_5d4() + cha
                 try:
                     self._emit_dialogue(f"{bark_name}: Roll {roll_total} (need >25)")
                 except Exception:
@@ -1363,13 +1337,11 @@ class GameEngine:
                     or "You've already refreshed in town this visit."
                 )
             else:
-                from .data_loader import get_npc_dialogue
-
                 prefix = get_npc_dialogue("town", "priestess_eira", None, c)
                 name = prefix.split(":", 1)[0] if prefix else "Eira"
                 self._emit_dialogue(prefix or "You kneel and offer a prayer.")
                 wis = int(getattr(c, "attributes", {}).get("Wisdom", 10))
-                roll_total = roll_damage("5d4") + wis
+                roll_total = roll_5d4() + wis
                 try:
                     self._emit_dialogue(f"{name}: Roll {roll_total} (need >25)")
                 except Exception:
@@ -1419,7 +1391,7 @@ class GameEngine:
                 )
             else:
                 con = int(getattr(c, "attributes", {}).get("Constitution", 10))
-                roll_total = roll_damage("5d4") + con
+                roll_total = roll_5d4() + con
                 try:
                     self._emit_dialogue(
                         f"You settle in to sleep... Roll {roll_total} (need >25)"
@@ -1589,8 +1561,6 @@ class GameEngine:
         # Centralized town menu rendering: header + character summary + menu.
         # Set town background
         try:
-            from .scene_manager import set_town_background
-
             ev = set_town_background()
             bg = ev.get("data", {}).get("background") if isinstance(ev, dict) else None
             if bg:
@@ -1656,8 +1626,6 @@ class GameEngine:
                 upcoming = 1
             if room.monster and upcoming == 50:
                 try:
-                    from .labyrinth import _monster_by_name
-
                     forced = _monster_by_name("Dragon", self.s.depth)
                     if forced:
                         room.monster = forced
@@ -1668,9 +1636,7 @@ class GameEngine:
             try:
                 forced_name = getattr(self.s, "next_forced_monster", None)
                 if forced_name:
-                    from .labyrinth import _monster_by_name as _MBN2
-
-                    forced_mon = _MBN2(str(forced_name), self.s.depth)
+                    forced_mon = _monster_by_name(str(forced_name), self.s.depth)
                     if forced_mon:
                         room.monster = forced_mon
                 # Clear forced marker after use
@@ -1684,9 +1650,9 @@ class GameEngine:
                 "description": room.description,
                 "gold_reward": room.gold_reward,
                 "has_chest": room.has_chest,
-                "chest_gold": getattr(room, "chest_gold", 0),
-                "chest_magic_item": getattr(room, "chest_magic_item", None),
-                "room_id": getattr(room, "room_id", None),
+                "chest_gold": room.chest_gold,
+                "chest_magic_item": room.chest_magic_item,
+                "room_id": room.room_id,
                 "monster": (
                     None
                     if not room.monster
@@ -1711,22 +1677,20 @@ class GameEngine:
                 isinstance(current_preview, dict)
                 and current_preview.get("depth") == target_depth
             ):
-                nxt = generate_room(target_depth, self.s.character)
+                nxt_monster = peek_next_monster(target_depth)
                 # Emulate 50th encounter forcing in preview for consistency
                 try:
                     upcoming_now = int(getattr(self.s, "monster_encounters", 0))
                     if room.get("monster"):
                         upcoming_now += 1
                     upcoming_next = upcoming_now + 1
-                    if getattr(nxt, "monster", None) and upcoming_next == 50:
-                        from .labyrinth import _monster_by_name as _MBN
-
-                        forced = _MBN("Dragon", target_depth)
+                    if nxt_monster and upcoming_next == 50:
+                        forced = _monster_by_name("Dragon", target_depth)
                         if forced:
-                            nxt.monster = forced
+                            nxt_monster = forced
                 except Exception:
                     pass
-                mname = getattr(getattr(nxt, "monster", None), "name", None)
+                mname = getattr(nxt_monster, "name", None)
                 self.s.peek_next = {"depth": target_depth, "monster": mname or None}
         except Exception:
             pass
@@ -1735,8 +1699,6 @@ class GameEngine:
         # Always ensure the room background is set when (re)entering a room,
         # even if the room was already generated (e.g., after combat victory)
         try:
-            from .scene_manager import set_room_background
-
             ev = set_room_background(room.get("description", ""))
             bg = ev.get("data", {}).get("background") if isinstance(ev, dict) else None
             if bg:
@@ -1747,8 +1709,6 @@ class GameEngine:
         # If just entering from town, show gate guard line once
         try:
             if self.s.subphase == "entering_dng_gate":
-                from .data_loader import get_npc_dialogue
-
                 gg = get_npc_dialogue("town", "gate_guard", None, self.s.character)
                 if gg:
                     # Ensure the guard line includes a name prefix for consistency
@@ -1870,8 +1830,6 @@ class GameEngine:
             self._emit_clear()
             # Set town background when returning from dungeon
             try:
-                from .scene_manager import set_town_background
-
                 ev = set_town_background()
                 bg = (
                     ev.get("data", {}).get("background")
@@ -1916,8 +1874,6 @@ class GameEngine:
                     self._emit_clear()
                     # Set town background when returning from dungeon
                     try:
-                        from .scene_manager import set_town_background
-
                         ev = set_town_background()
                         bg = (
                             ev.get("data", {}).get("background")
@@ -1952,7 +1908,7 @@ class GameEngine:
                 pass
             # New mechanics: 5d4 + Wisdom must be > 25
             wis = getattr(c, "attributes", {}).get("Wisdom", 10)
-            base = roll_damage("5d4")
+            base = roll_5d4()
             r = base + wis
             line = get_dialogue("combat", "divine_attempt", None, c)
             msg = (
@@ -1975,8 +1931,8 @@ class GameEngine:
                 else:
                     # Fallback: compute one now (and store it)
                     try:
-                        nxt = generate_room(self.s.depth + 1, c)
-                        mname = getattr(getattr(nxt, "monster", None), "name", None)
+                        nxt_monster = peek_next_monster(self.s.depth + 1)
+                        mname = getattr(nxt_monster, "name", None)
                         self.s.peek_next = {"depth": self.s.depth + 1, "monster": mname}
                     except Exception:
                         mname = None
@@ -2025,7 +1981,7 @@ class GameEngine:
             c = self.s.character
             per = getattr(c, "attributes", {}).get("Perception", 10)
             # New mechanics: 5d4 + Perception must be > 25
-            base = roll_damage("5d4")
+            base = roll_5d4()
             total = base + per
             listen = get_dialogue("system", "listen_roll", None, c)
             msg = (
@@ -2040,12 +1996,7 @@ class GameEngine:
                     f"You listen carefully... Roll {base} + PER {per} = {total} (need >25)"
                 )
             if total > 25:
-                from .data_loader import load_monster_sounds
-
-                mapping = {
-                    (s.get("name", "") or "").lower(): s.get("sound", "Unknown")
-                    for s in (load_monster_sounds() or [])
-                }
+                mapping = monster_sound_index()
                 # Use the preview for consistency with Divine and the actual next room
                 pv = getattr(self.s, "peek_next", None)
                 pname = None
@@ -2053,8 +2004,8 @@ class GameEngine:
                     pname = pv.get("monster")
                 else:
                     try:
-                        nxt = generate_room(self.s.depth + 1, c)
-                        pname = getattr(getattr(nxt, "monster", None), "name", None)
+                        nxt_monster = peek_next_monster(self.s.depth + 1)
+                        pname = getattr(nxt_monster, "name", None)
                         self.s.peek_next = {"depth": self.s.depth + 1, "monster": pname}
                     except Exception:
                         pname = None
@@ -2286,8 +2237,6 @@ class GameEngine:
 
     def _handle_combat(self, action: str) -> List[Event]:
         # Event-driven combat loop
-        import sys
-
         if self.debug:
             print(f"[DEBUG] _handle_combat called with action={action}")
             sys.stdout.flush()
@@ -2343,8 +2292,6 @@ class GameEngine:
                 sys.stdout.flush()
 
             try:
-                from .scene_manager import set_town_background
-
                 ev = set_town_background()
                 bg = (
                     ev.get("data", {}).get("background")
@@ -2458,8 +2405,6 @@ class GameEngine:
             self.s.phase = "town"
             self._emit_clear()
             try:
-                from .scene_manager import set_town_background
-
                 ev = set_town_background()
                 bg = (
                     ev.get("data", {}).get("background")
@@ -2557,8 +2502,6 @@ class GameEngine:
             return self._enter_room()
         # Set monster background as combat begins after spawn continue
         try:
-            from .scene_manager import set_monster_background
-
             ev = set_monster_background(mon.get("name"))
             bg = ev.get("data", {}).get("background") if isinstance(ev, dict) else None
             if bg:
@@ -2567,8 +2510,8 @@ class GameEngine:
             pass
         cdx = c.attributes.get("Dexterity", 10)
         mdx = mon.get("dexterity", 10)
-        c_roll = roll_damage("5d4") + cdx
-        m_roll = roll_damage("5d4") + mdx
+        c_roll = roll_5d4() + cdx
+        m_roll = roll_5d4() + mdx
         try:
             mname = str(mon.get("name", "Monster"))
         except Exception:
@@ -2674,7 +2617,7 @@ class GameEngine:
             menu = [
                 (
                     f"weapon:{i}",
-                    f"{i+1}) {w.name} ({getattr(w,'damage_die','1d4')})",
+                    f"{i+1}) {w.name} ({w.damage_die})",
                 )
                 for i, w in enumerate(c.weapons)
             ]
@@ -2705,7 +2648,7 @@ class GameEngine:
             self.s.phase = "dungeon"
             return self._enter_room()
         zone = self.s.combat.get("aim", "middle")
-        monster_defend_zone = random.choice(["high", "middle", "low"])
+        monster_defend_zone = random.choice(_ZONES)
         weapon = None
         if c.weapons and 0 <= weapon_index < len(c.weapons):
             weapon = c.weapons[weapon_index]
@@ -2720,7 +2663,7 @@ class GameEngine:
             mon.get("armor_class", 10)
             - self.s.combat.get("enemy", {}).get("debuffs", {}).get("ac_penalty", 0),
         )
-        attack_die = roll_damage("5d4")
+        attack_die = roll_5d4()
         str_mod = c.attributes.get("Strength", 10)
         attack_roll = attack_die + str_mod
         self._emit_combat_update(
@@ -2744,7 +2687,7 @@ class GameEngine:
         if attack_die == 20:
             # Unarmed does fixed 2 damage, weapons roll their damage die
             if weapon:
-                dmg_die = getattr(weapon, "damage_die", "1d2")
+                dmg_die = weapon.damage_die
                 base_dmg = roll_damage(dmg_die)
             else:
                 base_dmg = 2  # Fixed unarmed damage
@@ -2752,7 +2695,7 @@ class GameEngine:
             base_dmg += math.ceil(str_mod / 2) + self.s.combat.get("buffs", {}).get(
                 "damage_bonus", 0
             )
-            if weapon and getattr(weapon, "damaged", False):
+            if weapon and weapon.damaged:
                 base_dmg = max(1, base_dmg // 2)
             dmg = max(1, base_dmg)
             crit = int(dmg * 1.5)
@@ -2801,7 +2744,7 @@ class GameEngine:
         if attack_roll >= enemy_ac:
             # Unarmed does fixed 2 damage, weapons roll their damage die
             if weapon:
-                dmg_die = getattr(weapon, "damage_die", "1d2")
+                dmg_die = weapon.damage_die
                 base_dmg = roll_damage(dmg_die)
             else:
                 base_dmg = 2  # Fixed unarmed damage
@@ -2809,7 +2752,7 @@ class GameEngine:
             base_dmg += math.ceil(str_mod / 2) + self.s.combat.get("buffs", {}).get(
                 "damage_bonus", 0
             )
-            if weapon and getattr(weapon, "damaged", False):
+            if weapon and weapon.damaged:
                 base_dmg = max(1, base_dmg // 2)
             dmg = max(1, base_dmg)
             mon["hp"] -= dmg
@@ -2831,8 +2774,6 @@ class GameEngine:
                 pass
             # Monster hurt reaction flavor line, when available
             try:
-                from .data_loader import get_npc_dialogue
-
                 hurt = get_npc_dialogue("monster", "hurt_reaction", None, mon)
                 if hurt:
                     # Use standardized monster speech formatter to ensure name prefix
@@ -2864,12 +2805,10 @@ class GameEngine:
                     damage_roll = max(
                         1, roll_damage(getattr(comp, "damage_die", "2d6"))
                     )
-                    attack_value = random.randint(1, 20) + getattr(comp, "strength", 0)
+                    attack_value = roll_d20() + getattr(comp, "strength", 0)
                     if attack_value > mon.get("armor_class", 10):
                         mon["hp"] -= damage_roll
                         # Use dialogue-based hit message when available
-                        from .data_loader import get_dialogue
-
                         hit_line = get_dialogue("companion", "attack_hit", None, c)
                         if hit_line:
                             try:
@@ -2898,8 +2837,6 @@ class GameEngine:
                             self._emit_state()
                             return self._flush()
                     else:
-                        from .data_loader import get_dialogue
-
                         miss_line = get_dialogue("companion", "attack_miss", None, c)
                         self._emit_combat_update(
                             miss_line.format(comp=comp.name)
@@ -2939,11 +2876,11 @@ class GameEngine:
             buffs["invisibility_charges"] = buffs.get("invisibility_charges", 0) - 1
             self._emit_combat_update("The monster swings wildly but hits nothing!")
             return self._combat_next_turn("player")
-        monster_zone = random.choice(["high", "middle", "low"])
+        monster_zone = random.choice(_ZONES)
         player_defend_zone = self.s.combat.get("defend", "middle")
         self._emit_combat_update(f"You brace to defend {player_defend_zone}.")
         ac = compute_armor_class(c, buffs.get("ac_bonus", 0))
-        attack_die = roll_damage("5d4")
+        attack_die = roll_5d4()
         monster_strength = mon.get("strength", 10)
         strength_bonus = monster_strength // 2
         attack_roll = attack_die + strength_bonus
@@ -3045,8 +2982,6 @@ class GameEngine:
         # Reset text for a dedicated revival screen with a death background, then increment death count
         self._emit_clear()
         try:
-            from .scene_manager import set_death_background
-
             ev = set_death_background()
             bg = ev.get("data", {}).get("background") if isinstance(ev, dict) else None
             if bg:
@@ -3069,7 +3004,7 @@ class GameEngine:
         death_count = int(getattr(c, "death_count", 1))
 
         wis = int(getattr(c, "attributes", {}).get("Wisdom", 10))
-        rollv = roll_damage("5d4") + wis
+        rollv = roll_5d4() + wis
         dc = 15 + 5 * death_count
 
         # Announce attempt (keep text style consistent; leverage dialogues when present)
@@ -3170,20 +3105,11 @@ class GameEngine:
             return self._flush()
 
     def _combat_victory(self, room: Dict[str, Any], mon: Dict[str, Any]) -> List[Event]:
-        from .data_loader import (
-            load_monsters,
-            load_spells,
-            load_magic_items,
-            load_weapons,
-            load_armors,
-        )
-
         # Show victory on a clean page
         self._emit_clear()
 
         # Depth-scaled XP reward
-        monsters = load_monsters()
-        entry = next((m for m in monsters if m.get("name") == mon.get("name")), None)
+        entry = monster_index().get(mon.get("name"))
         base_xp = int(entry.get("xp", 10)) if entry else 10
         depth = max(1, int(getattr(self.s, "depth", 1)))
         # Progressive depth multiplier: 1.0, 1.5, 2.0, 2.5, ...
@@ -3431,11 +3357,9 @@ class GameEngine:
                 w = 0
             weights.append(w)
             total += w
-        import random as _r
-
         if total <= 0:
-            return _r.choice(items)
-        pick = _r.randint(1, total)
+            return random.choice(items)
+        pick = random.randint(1, total)
         acc = 0
         for it, w in zip(items, weights):
             acc += w
@@ -3467,13 +3391,9 @@ class GameEngine:
                 kind = parts[1].lower() if len(parts) > 1 else "bonus"
                 if attr:
                     if kind == "penalty":
-                        import random as _r
-
-                        delta = -_r.choice([1, 2, 3])
+                        delta = -random.choice([1, 2, 3])
                     else:
-                        import random as _r
-
-                        delta = _r.choice([2, 3, 4, 5])
+                        delta = random.choice([2, 3, 4, 5])
         if not attr or delta == 0:
             # Fallback: charisma +2
             attr = "Charisma"
@@ -3744,17 +3664,10 @@ class GameEngine:
 
         lname = name.lower()
         if lname == "summon creature" or lname == "summon companion":
-            roll = roll_damage("5d4")
+            roll = roll_5d4()
             self._emit_combat_update(
                 f"You attempt to summon a companion... Roll {roll}"
             )
-            # Use the richer table-driven summoning logic from companion.py
-            try:
-                from .companion import SUMMON_TABLE, create_companion_from_entry
-            except Exception:
-                SUMMON_TABLE = []
-                create_companion_from_entry = None  # type: ignore
-
             # Compute Int/Cha modifiers (D&D-style)
             int_stat = c.attributes.get("Intelligence", c.attributes.get("Int", 10))
             cha_stat = c.attributes.get("Charisma", c.attributes.get("Cha", 10))
@@ -3762,16 +3675,10 @@ class GameEngine:
             cha_mod = (cha_stat - 10) // 2
             final_roll = roll + int_mod + cha_mod
 
-            # Determine eligible entries and choose the best tier, else fail
-            eligible = [
-                e for e in (SUMMON_TABLE or []) if final_roll >= e.get("min_roll", 999)
-            ]
-            if eligible and create_companion_from_entry is not None:
-                best_min = max(e.get("min_roll", 0) for e in eligible)
-                candidates = [e for e in eligible if e.get("min_roll", 0) == best_min]
-                import random as _r
-
-                entry = _r.choice(candidates)
+            # Use the table-driven summoning tiers from companion.py, else fail
+            candidates = summon_candidates(final_roll)
+            if candidates:
+                entry = random.choice(candidates)
                 comp = create_companion_from_entry(entry)
                 c.companion = comp
                 try:
@@ -3860,7 +3767,7 @@ class GameEngine:
         mon = room.get("monster")
         # Use new mechanics: 5d4 + (Wisdom - 10)
         wis = c.attributes.get("Wisdom", 10)
-        base = roll_damage("5d4")
+        base = roll_5d4()
         wis_bonus = wis - 10
         rollv = base + wis_bonus
         self._emit_combat_update(
@@ -3922,19 +3829,13 @@ class GameEngine:
         # Include any temporary charisma bonus from buffs (e.g., potion)
         cha_bonus = self.s.combat.get("buffs", {}).get("cha_bonus", 0)
         eff_cha = cha + cha_bonus
-        roll_raw = roll_damage("5d4")
+        roll_raw = roll_5d4()
         # New charm check: roll(5d4) + ceil(CHA/2) >= 20 + floor(difficulty/2)
         cha_term = math.ceil(eff_cha / 2)
         rollv = roll_raw + cha_term
         # Difficulty-based threshold from monsters.json difficulty
         try:
-            from .data_loader import load_monsters
-
-            monsters = load_monsters() or []
-            entry = next(
-                (m for m in monsters if m.get("name") == mon.get("name")),
-                None,
-            )
+            entry = monster_index().get(mon.get("name"))
             diff = int(entry.get("difficulty", 1)) if entry else 1
         except Exception:
             entry = None
@@ -4025,7 +3926,7 @@ class GameEngine:
         dex_bonus = math.ceil(dex / 2)
         monster_dex = mon.get("dexterity", 10)
         monster_bonus = math.ceil(monster_dex / 2)
-        attack_die = roll_damage("5d4")
+        attack_die = roll_5d4()
         rollv = attack_die + dex_bonus
         threshold = 15 + monster_bonus
         self._emit_combat_update(
@@ -4054,7 +3955,7 @@ class GameEngine:
         # Dedicated examine result screen
         self._emit_clear()
         wis = c.attributes.get("Wisdom", 10)
-        rollv = roll_damage("5d4") + wis
+        rollv = roll_5d4() + wis
         self._emit_combat_update(
             f"You examine the {mon['name']}... (Wisdom check: {rollv})"
         )
@@ -4065,15 +3966,9 @@ class GameEngine:
             if "dexterity" in mon:
                 self._emit_combat_update(f"Dexterity: {mon['dexterity']}")
             # Add a brief monster description from data/monsters_desc.json when available
-            try:
-                from .data_loader import load_monster_descriptions
-
-                descs = load_monster_descriptions() or {}
-                desc = descs.get(mon["name"]) or descs.get(str(mon["name"]).title())
-                if desc:
-                    self._emit_combat_update(f"It's a {mon['name']} - {desc}")
-            except Exception:
-                pass
+            desc = get_monster_description(mon["name"])
+            if desc:
+                self._emit_combat_update(f"It's a {mon['name']} - {desc}")
         else:
             self._emit_combat_update(
                 "You can't make out the creature's capabilities clearly."
@@ -4745,7 +4640,7 @@ class GameEngine:
 
         # Weapons (exclude unsellable; only shop-stock can be sold)
         for i, w in enumerate(c.weapons):
-            if getattr(w, "damaged", False):
+            if w.damaged:
                 continue
             if getattr(w, "unsellable", False):
                 continue
@@ -4756,7 +4651,7 @@ class GameEngine:
             sellable.append(("w", i, w.name))
         # Armors (owned and not currently equipped; exclude unsellable; only shop-stock)
         for i, a in enumerate(c.armors_owned):
-            if getattr(a, "damaged", False):
+            if a.damaged:
                 continue
             if getattr(a, "unsellable", False):
                 continue
@@ -4833,7 +4728,7 @@ class GameEngine:
             if index < 0 or index >= len(c.weapons):
                 return self._shop_sell_menu()
             w = c.weapons[index]
-            if getattr(w, "damaged", False) or index == c.equipped_weapon_index:
+            if w.damaged or index == c.equipped_weapon_index:
                 # Cannot sell damaged or equipped
                 self._emit_dialogue(
                     get_dialogue("shop", "cannot_sell_equipped", None, c)
@@ -4866,7 +4761,7 @@ class GameEngine:
             if index < 0 or index >= len(c.armors_owned):
                 return self._shop_sell_menu()
             a = c.armors_owned[index]
-            if getattr(a, "damaged", False) or (c.armor and a.name == c.armor.name):
+            if a.damaged or (c.armor and a.name == c.armor.name):
                 self._emit_dialogue(
                     get_dialogue("shop", "cannot_sell_equipped", None, c)
                     or "You cannot sell equipped armor. Unequip it first."
@@ -4986,13 +4881,16 @@ class GameEngine:
         )
         # Equipped lines
         if c:
+            weapons = c.weapons
+            armor = c.armor
+            ewi = c.equipped_weapon_index
             cw = "Unarmed"
             damage_display = "—"
-            if 0 <= c.equipped_weapon_index < len(c.weapons):
-                w = c.weapons[c.equipped_weapon_index]
-                cw = w.name + (" (damaged)" if getattr(w, "damaged", False) else "")
+            if 0 <= ewi < len(weapons):
+                w = weapons[ewi]
+                cw = w.label
                 try:
-                    damage_display = getattr(w, "damage_die", "1d2")
+                    damage_display = w.damage_die
                 except Exception:
                     damage_display = "1d2"
             line = get_dialogue("system", "inventory_equipped_weapon", None, c)
@@ -5008,10 +4906,9 @@ class GameEngine:
                 self._emit_dialogue(f"Equipped weapon: {cw}")
 
             armor_display = "None"
-            if c.armor:
-                armor_display = c.armor.name + (
-                    " (damaged)" if getattr(c.armor, "damaged", False) else ""
-                )
+            ac = armor.armor_class if armor else 10
+            if armor:
+                armor_display = armor.label
             line = get_dialogue("system", "inventory_equipped_armor", None, c)
             if line:
                 try:
@@ -5020,16 +4917,16 @@ class GameEngine:
                         line.format(
                             name=armor_display,
                             armor=armor_display,
-                            ac=(c.armor.armor_class if c.armor else 10),
+                            ac=ac,
                         )
                     )
                 except Exception:
                     self._emit_dialogue(
-                        f"Equipped armor: {armor_display} (AC {c.armor.armor_class if c.armor else 10})"
+                        f"Equipped armor: {armor_display} (AC {ac})"
                     )
             else:
                 self._emit_dialogue(
-                    f"Equipped armor: {armor_display} (AC {c.armor.armor_class if c.armor else 10})"
+                    f"Equipped armor: {armor_display} (AC {ac})"
                 )
         g = lambda key, dflt: get_dialogue("inventory", key, None, c) or dflt
         menu = [
@@ -5068,11 +4965,11 @@ class GameEngine:
             ]
             idx = 2
             for i, w in enumerate(c.weapons):
-                label = w.name + (" (damaged)" if getattr(w, "damaged", False) else "")
+                label = w.label
                 menu.append(
                     (
                         f"inv:weapon:set:{i}",
-                        f"{idx}) {label} ({getattr(w,'damage_die','1d4')})",
+                        f"{idx}) {label} ({w.damage_die})",
                     )
                 )
                 idx += 1
@@ -5080,7 +4977,10 @@ class GameEngine:
             self._emit_state()
             return self._flush()
         if action.startswith("inv:weapon:set:"):
-            i = int(action.rsplit(":", 1)[-1])
+            try:
+                i = int(action.rsplit(":", 1)[-1])
+            except ValueError:
+                i = -1
             if c and 0 <= i < len(c.weapons):
                 c.equipped_weapon_index = i
                 msg = (
@@ -5105,12 +5005,11 @@ class GameEngine:
                     or "You have no armor."
                 )
                 return self._inventory_show()
-            options = []
-            if c.armor:
-                options.append(c.armor)
-            options.extend(
-                a for a in c.armors_owned if (not c.armor or a.name != c.armor.name)
-            )
+            armor = c.armor
+            equipped_name = armor.name if armor else None
+            options = ([armor] if armor else []) + [
+                a for a in c.armors_owned if a.name != equipped_name
+            ]
             menu = [
                 (
                     "inv:armor:back",
@@ -5119,7 +5018,7 @@ class GameEngine:
             ]
             idx = 2
             for i, a in enumerate(options):
-                label = a.name + (" (damaged)" if getattr(a, "damaged", False) else "")
+                label = a.label
                 menu.append(
                     (f"inv:armor:set:{i}", f"{idx}) {label} (AC {a.armor_class})")
                 )
@@ -5132,7 +5031,10 @@ class GameEngine:
         if action.startswith("inv:armor:set:"):
             if not c:
                 return self._inventory_show()
-            index = int(action.rsplit(":", 1)[-1])
+            try:
+                index = int(action.rsplit(":", 1)[-1])
+            except ValueError:
+                index = -1
             names = (self.s.subphase or "").split("|") if self.s.subphase else []
             if 0 <= index < len(names):
                 name = names[index]
@@ -5350,18 +5252,16 @@ class GameEngine:
         self._emit_dialogue(
             get_dialogue("shop", "shop_header", None, c) or "=== Shop ==="
         )
-        from .data_loader import get_npc_dialogue
-
         self._emit_dialogue(
             get_npc_dialogue("town", "weaponsmith_thorin", None, c)
             or "Thorin: Blacksmith at your service."
         )
         self._emit_dialogue(f"Gold: {c.gold}g")
-        damaged_weapons = [w for w in c.weapons if getattr(w, "damaged", False)]
+        damaged_weapons = [w for w in c.weapons if w.damaged]
         damaged_armors = [
             a
             for a in (c.armors_owned + ([c.armor] if c.armor else []))
-            if a and getattr(a, "damaged", False)
+            if a and a.damaged
         ]
         if not damaged_weapons and not damaged_armors:
             self._emit_dialogue(
@@ -5522,8 +5422,6 @@ class GameEngine:
             self._emit_scene("town_menu/gambling.png")
         except Exception:
             pass
-        from .data_loader import get_npc_dialogue
-
         intro = get_npc_dialogue("town", "gambler_seth", None, c)
         if intro:
             self._emit_dialogue(intro)
@@ -5658,9 +5556,7 @@ class GameEngine:
             try:
                 roll = roll_damage(f"1d{sides}")
             except Exception:
-                import random as _r
-
-                roll = _r.randint(1, sides)
+                roll = random.randint(1, sides)
             self._emit_dialogue(f"You roll: {roll}")
             bet = int(g.get("bet", 0))
             if roll == guess:
@@ -5711,12 +5607,7 @@ class GameEngine:
                 # Record and announce player's choice
                 g["range_choice"] = r
                 self._emit_dialogue(f"You chose {r[0]}-{r[1]} on a d20.")
-                try:
-                    d = roll_damage("1d20")
-                except Exception:
-                    import random as _r
-
-                    d = _r.randint(1, 20)
+                d = roll_d20()
                 self._emit_dialogue(f"You roll: {d}")
                 bet = int(g.get("bet", 0))
                 if r[0] <= d <= r[1]:
@@ -5876,8 +5767,6 @@ class GameEngine:
     def _quests_menu(self) -> List[Event]:
         c = self.s.character
         from .quests import quest_manager
-        from .data_loader import get_dialogue
-
         # Header
         header = get_dialogue("town", "town_bulletin", None, c)
         self._emit_dialogue(header or "Town Bulletin: \n=== Side Quests ===")
@@ -5,7 +5,7 @@ import math
 from typing import List, Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Weapon:
     name: str
     damage_die: str
@@ -13,8 +13,13 @@ class Weapon:
     # Rewards from the labyrinth cannot be sold in shops
     unsellable: bool = False
 
+    @property
+    def label(self) -> str:
+        """Display name, suffixed with " (damaged)" when damaged."""
+        return self.name + (" (damaged)" if self.damaged else "")
 
-@dataclass
+
+@dataclass(slots=True)
 class Armor:
     name: str
     armor_class: int
@@ -22,6 +27,11 @@ class Armor:
     # Rewards from the labyrinth cannot be sold in shops
     unsellable: bool = False
 
+    @property
+    def label(self) -> str:
+        """Display name, suffixed with " (damaged)" when damaged."""
+        return self.name + (" (damaged)" if self.damaged else "")
+
 
 @dataclass
 class Monster:
@@ -180,24 +190,16 @@ class Character:
         if self.armor:
             armor_ac = (
                 self.armor.armor_class // 2
-                if getattr(self.armor, "damaged", False)
+                if self.armor.damaged
                 else self.armor.armor_class
             )
-            armor_name = self.armor.name + (
-                " (damaged)" if getattr(self.armor, "damaged", False) else ""
-            )
+            armor_name = self.armor.label
         else:
             # No armor: add 5 to AC (natural protection)
             armor_ac = 5
         ac = base_ac + armor_ac
         current_weapon = (
-            self.weapons[self.equipped_weapon_index].name
-            + (
-                " (damaged)"
-                if 0 <= self.equipped_weapon_index < len(self.weapons)
-                and getattr(self.weapons[self.equipped_weapon_index], "damaged", False)
-                else ""
-            )
+            self.weapons[self.equipped_weapon_index].label
             if 0 <= self.equipped_weapon_index < len(self.weapons)
             else "Unarmed"
         )
@@ -1,3 +1,5 @@
+import functools
+import itertools
 import random
 from dataclasses import dataclass
 from typing import List, Optional
@@ -11,10 +13,11 @@ from .data_loader import (
     load_potions,
     load_spells,
     get_dialogue,
+    monster_index,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     description: str
     monster: Optional[Monster]
@@ -26,27 +29,43 @@ class Room:
 
 
 def _monster_by_name(name: str, depth: int) -> Optional[Monster]:
-    from .data_loader import load_monsters
-
     data = load_monsters() or []
     entry = next(
         (m for m in data if (m.get("name") or "").lower() == name.lower()), None
     )
     if not entry:
         return None
-    # Use base stats directly (no depth scaling)
-    hp = int(entry.get("base_hp", 8))
-    ac = int(entry.get("base_ac", 12))
-    dex = int(entry.get("base_dex", 10))
-    strength = int(entry.get("base_strength", 10))
-    dmg_die = entry.get("damage_die", "1d6")
-    return Monster(
-        name=entry.get("name", name),
-        hp=hp,
-        armor_class=ac,
-        damage_die=dmg_die,
-        dexterity=dex,
-        strength=strength,
+    return Monster(**_monster_kwargs(entry, name))
+
+
+def _monster_kwargs(entry: dict, name: str = "Monster") -> dict:
+    """Monster constructor arguments from a monsters.json entry.
+
+    Uses base stats directly (no depth scaling).
+    """
+    return {
+        "name": entry.get("name", name),
+        "hp": int(entry.get("base_hp", 8)),
+        "armor_class": int(entry.get("base_ac", 12)),
+        "damage_die": entry.get("damage_die", "1d6"),
+        "dexterity": int(entry.get("base_dex", 10)),
+        "strength": int(entry.get("base_strength", 10)),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _wander_table() -> tuple:
+    """Return (monster kwargs, cumulative wander_chance weights) for wandering monsters.
+
+    Built once per process from data/monsters.json.
+    """
+    # Filter out Evil Necromancer for wandering monsters
+    wandering = [
+        m for m in load_monsters() or [] if m.get("name") != "Evil Necromancer"
+    ]
+    return (
+        [_monster_kwargs(m) for m in wandering],
+        list(itertools.accumulate(m.get("wander_chance", 0) for m in wandering)),
     )
 
 
@@ -69,8 +88,7 @@ def generate_room(depth: int, character=None) -> Room:
     # pick a thematic room id (1-6) for dialogue lookup
     room_id = random.randint(1, 6)
 
-    # Always choose a monster using wander_chance weighting, but at depth 5 force Dragon
-    monster = _monster_by_name("Dragon", depth) if depth == 5 else random_monster(depth)
+    monster = peek_next_monster(depth)
 
     # Prefer a numbered room description; fall back to generic labyrinth entry text
     desc = (
@@ -89,34 +107,24 @@ def generate_room(depth: int, character=None) -> Room:
     )
     # Determine per-monster base gold from data/monsters.json (gold_range)
     gold = random.randint(5, 15) + depth * 2  # fallback
-    try:
-        from .data_loader import load_monsters as _lm
-
-        data = _lm() or []
-        mname = getattr(monster, "name", None)
-        entry = next((m for m in data if (m.get("name") or "") == (mname or "")), None)
-        if (
-            entry
-            and isinstance(entry.get("gold_range"), list)
-            and len(entry["gold_range"]) == 2
-        ):
-            lo, hi = entry["gold_range"][0], entry["gold_range"][1]
-            try:
-                lo = int(lo)
-                hi = int(hi)
-                if hi < lo:
-                    lo, hi = hi, lo
-                gold = random.randint(lo, hi)
-            except Exception:
-                # keep fallback gold
-                pass
-    except Exception:
-        # keep fallback gold
-        pass
-    try:
+    entry = monster_index().get(getattr(monster, "name", None))
+    if (
+        entry
+        and isinstance(entry.get("gold_range"), list)
+        and len(entry["gold_range"]) == 2
+    ):
+        lo, hi = entry["gold_range"][0], entry["gold_range"][1]
+        try:
+            lo = int(lo)
+            hi = int(hi)
+            if hi < lo:
+                lo, hi = hi, lo
+            gold = random.randint(lo, hi)
+        except (TypeError, ValueError):
+            # keep fallback gold
+            pass
+    if monster is not None:
         monster.gold_reward = gold
-    except Exception:
-        pass
     return Room(
         description=desc,
         monster=monster,
@@ -128,31 +136,21 @@ def generate_room(depth: int, character=None) -> Room:
     )
 
 
-def random_monster(depth: int) -> Monster:
-    data = load_monsters()
-    if data:
-        # Filter out Evil Necromancer for wandering monsters
-        wandering_monsters = [m for m in data if m.get("name") != "Evil Necromancer"]
+def peek_next_monster(depth: int) -> Optional[Monster]:
+    """Roll only the monster a room at `depth` would contain.
 
+    Uses the same selection as generate_room() (wander_chance weighting, Dragon
+    forced at depth 5) but skips chest, description and gold rolls, for callers
+    that just need to preview what lies ahead.
+    """
+    return _monster_by_name("Dragon", depth) if depth == 5 else random_monster(depth)
+
+
+def random_monster(depth: int) -> Monster:
+    if load_monsters():
         # Use weighted selection based on wander_chance
-        weights = [m.get("wander_chance", 0) for m in wandering_monsters]
-        m = random.choices(wandering_monsters, weights=weights, k=1)[0]
-
-        name = m.get("name", "Monster")
-        # Use base stats directly (no depth scaling)
-        hp = int(m.get("base_hp", 8))
-        ac = int(m.get("base_ac", 12))
-        dex = int(m.get("base_dex", 10))
-        strength = int(m.get("base_strength", 10))
-        dmg_die = m.get("damage_die", "1d6")
-        return Monster(
-            name=name,
-            hp=hp,
-            armor_class=ac,
-            damage_die=dmg_die,
-            dexterity=dex,
-            strength=strength,
-        )
+        stats, cum_weights = _wander_table()
+        return Monster(**random.choices(stats, cum_weights=cum_weights, k=1)[0])
     # fallback
     ac = 11 + min(depth // 2, 4)
     hp = 6 + depth * 2
@@ -178,8 +176,12 @@ def random_monster(depth: int) -> Monster:
     )
 
 
-def generate_magic_item() -> str:
-    """Generate a random magic item name based on weighted chances."""
+@functools.lru_cache(maxsize=1)
+def _magic_item_pool() -> tuple:
+    """Return (names, cumulative weights) for chest item rolls.
+
+    Built once per process from the static data files.
+    """
     # Build a candidate pool from several data sources. When JSON entries provide a
     # numeric 'chance' field, use it as a weight. Otherwise use conservative defaults.
     candidates = []  # list of tuples (name, weight)
@@ -223,11 +225,15 @@ def generate_magic_item() -> str:
         weight = int(s.get("chance", 1)) if s.get("chance") is not None else 1
         candidates.append((name, max(1, weight)))
 
-    if not candidates:
-        return "Unknown Item"
-
-    # Build weighted choice list
     names = [c[0] for c in candidates]
-    weights = [c[1] for c in candidates]
-    selected = random.choices(names, weights=weights, k=1)[0]
+    cum_weights = list(itertools.accumulate(c[1] for c in candidates))
+    return names, cum_weights
+
+
+def generate_magic_item() -> str:
+    """Generate a random magic item name based on weighted chances."""
+    names, cum_weights = _magic_item_pool()
+    if not names:
+        return "Unknown Item"
+    selected = random.choices(names, cum_weights=cum_weights, k=1)[0]
     return selected or "Unknown Item"
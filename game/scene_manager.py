@@ -37,32 +37,25 @@ def set_death_background():
     return create_scene_event("death.png")
 
 
-def set_room_background(room_description):
-    """Set background based on room description with precise matching.
-
-    Strategy:
-    - Prefer explicit shape near a room noun (room|hall|chamber|gallery|vault).
-    - Use word boundaries to avoid false positives (e.g., "square-cut").
-    - Fall back to generic nouns if no shape is found.
-    """
-    room_desc = (room_description or "").lower()
+# Common room nouns used by the shape patterns below
+_ROOM_NOUNS = r"(?:room|hall|chamber|gallery|vault)"
 
-    # Common room nouns and shapes
-    nouns = r"(?:room|hall|chamber|gallery|vault)"
-
-    patterns = [
+# Room-shape patterns, compiled once at import since every room entry runs them
+_ROOM_SHAPE_PATTERNS = [
+    (re.compile(pat), img)
+    for pat, img in [
         # Rectangular explicitly near a noun
         (
-            rf"\brectangular\b[^\n\r]*\b{nouns}\b|\b{nouns}\b[^\n\r]*\brectangular\b",
+            rf"\brectangular\b[^\n\r]*\b{_ROOM_NOUNS}\b|\b{_ROOM_NOUNS}\b[^\n\r]*\brectangular\b",
             "rooms/rectangular_hall.png",
         ),
         (
-            rf"\brectangle\b[^\n\r]*\b{nouns}\b|\b{nouns}\b[^\n\r]*\brectangle\b",
+            rf"\brectangle\b[^\n\r]*\b{_ROOM_NOUNS}\b|\b{_ROOM_NOUNS}\b[^\n\r]*\brectangle\b",
             "rooms/rectangular_hall.png",
         ),
         # Square explicitly near a noun or clear phrases like "perfectly square"
         (
-            rf"\bsquare\b[^\n\r]*\b{nouns}\b|\b{nouns}\b[^\n\r]*\bsquare\b",
+            rf"\bsquare\b[^\n\r]*\b{_ROOM_NOUNS}\b|\b{_ROOM_NOUNS}\b[^\n\r]*\bsquare\b",
             "rooms/square_vault.png",
         ),
         (r"\bperfectly\s+square\b", "rooms/square_vault.png"),
@@ -73,26 +66,35 @@ def set_room_background(room_description):
         (r"\boval\b", "rooms/oval_gallery.png"),
         (r"\bcircular\b|\bcircle\b", "rooms/circular_chamber.png"),
     ]
+]
+
+# Secondary heuristics (no explicit shape found)
+_ROOM_NOUN_PATTERNS = [
+    (re.compile(r"\bvault\b"), "rooms/square_vault.png"),
+    (re.compile(r"\bpillared\b"), "rooms/hexagonal_pillared_room.png"),
+    (re.compile(r"\bgallery\b"), "rooms/oval_gallery.png"),
+    (re.compile(r"\bhall\b"), "rooms/rectangular_hall.png"),
+    (re.compile(r"\bchamber\b|\broom\b"), "rooms/circular_chamber.png"),
+]
+
+
+def set_room_background(room_description):
+    """Set background based on room description with precise matching.
+
+    Strategy:
+    - Prefer explicit shape near a room noun (room|hall|chamber|gallery|vault).
+    - Use word boundaries to avoid false positives (e.g., "square-cut").
+    - Fall back to generic nouns if no shape is found.
+    """
+    room_desc = (room_description or "").lower()
+
+    for pat, img in _ROOM_SHAPE_PATTERNS:
+        if pat.search(room_desc):
+            return create_scene_event(img)
 
-    for pat, img in patterns:
-        try:
-            if re.search(pat, room_desc):
-                return create_scene_event(img)
-        except re.error:
-            # If a pattern fails to compile for some reason, skip it safely
-            continue
-
-    # Secondary heuristics (no explicit shape found)
-    if re.search(r"\bvault\b", room_desc):
-        return create_scene_event("rooms/square_vault.png")
-    if re.search(r"\bpillared\b", room_desc):
-        return create_scene_event("rooms/hexagonal_pillared_room.png")
-    if re.search(r"\bgallery\b", room_desc):
-        return create_scene_event("rooms/oval_gallery.png")
-    if re.search(r"\bhall\b", room_desc):
-        return create_scene_event("rooms/rectangular_hall.png")
-    if re.search(r"\bchamber\b|\broom\b", room_desc):
-        return create_scene_event("rooms/circular_chamber.png")
+    for pat, img in _ROOM_NOUN_PATTERNS:
+        if pat.search(room_desc):
+            return create_scene_event(img)
 
     # Fallback
     return create_scene_event("labyrinth.png")
@@ -623,7 +623,7 @@ def sell_items(
             )
             if entry and int(entry.get("price", 0)) > 0:
                 # Skip damaged weapons from being sellable
-                if getattr(w, "damaged", False):
+                if w.damaged:
                     # show as not sellable in the list
                     sell_options.append(
                         (
@@ -647,7 +647,7 @@ def sell_items(
             )
             if entry and int(entry.get("price", 0)) > 0:
                 # Skip damaged armor from sell list
-                if getattr(a, "damaged", False):
+                if a.damaged:
                     sell_options.append(
                         (
                             menu_idx,
@@ -828,14 +828,14 @@ def sell_items(
                 print(msg)
             continue
         # Prompt for confirmation explicitly so the player sees a prompt (web UI shows an input box)
-        confirm_text = (
-            get_dialogue("shop", "confirm_sale", None, character)
-            or f"Confirm sale of {item_name} for appraisal? (y/n)"
-        )
-        try:
-            text = confirm_text.format(name=item_name, price=appraised_price)
-        except Exception:
-            text = confirm_text
+        confirm_text = get_dialogue("shop", "confirm_sale", None, character)
+        if confirm_text:
+            try:
+                text = confirm_text.format(name=item_name, price=appraised_price)
+            except Exception:
+                text = confirm_text
+        else:
+            text = f"Confirm sale of {item_name} for appraisal? (y/n)"
         if emitter:
             _say(emitter, text)
             _say(emitter, get_dialogue("system", "enter", None, character) or ">")
@@ -3,7 +3,7 @@ from __future__ import annotations
 import random
 from typing import Callable, Optional
 
-from .dice import roll_damage
+from .dice import roll_d20, roll_damage
 from .entities import Character
 from .companion import name_companion, heal_companion
 from .magic_items import remove_cursed_item
@@ -323,7 +323,7 @@ def rest(
         print(intro)
     con = character.attributes.get("Constitution", 10)
     bonus = 2 if con >= 15 else (1 if con >= 12 else 0)
-    roll = random.randint(1, 20) + bonus
+    roll = roll_d20() + bonus
     character.rest_attempted = True
     if roll >= 12:
         heal = roll_damage("2d6")
@@ -371,13 +371,13 @@ def weaponsmith(
         _say(emitter, gold_line)
     else:
         print(gold_line)
-    damaged_weapons = [w for w in character.weapons if getattr(w, "damaged", False)]
+    damaged_weapons = [w for w in character.weapons if w.damaged]
     damaged_armors = [
         a
         for a in (
             character.armors_owned + ([character.armor] if character.armor else [])
         )
-        if a and getattr(a, "damaged", False)
+        if a and a.damaged
     ]
     if not damaged_weapons and not damaged_armors:
         # Show a single no-damaged line from Thorin (or fallback system message)
@@ -1031,7 +1031,7 @@ def praying(
     # Apply the heal immediately (minor)
     character.hp = min(character.max_hp, character.hp + heal)
     # Roll with wisdom bonus to determine stronger effect
-    roll = random.randint(1, 20) + bonus
+    roll = roll_d20() + bonus
     if roll > 15:
         out = (
             get_dialogue("town", "praying_heal", None, character)